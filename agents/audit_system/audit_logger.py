@@ -2,10 +2,12 @@
 Audit Logger - Track all agent activities for compliance.
 """
 
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional
+import itertools
 import json
 import logging
 
@@ -20,6 +22,16 @@ class AuditLevel(Enum):
     CRITICAL = "CRITICAL"
 
 
+# Standard logging level per audit level
+_LOGGING_LEVELS = {
+    AuditLevel.DEBUG: logging.DEBUG,
+    AuditLevel.INFO: logging.INFO,
+    AuditLevel.WARNING: logging.WARNING,
+    AuditLevel.ERROR: logging.ERROR,
+    AuditLevel.CRITICAL: logging.CRITICAL,
+}
+
+
 @dataclass
 class AuditEvent:
     """Single audit event."""
@@ -64,6 +76,9 @@ class AuditLogger:
         self.events: List[AuditEvent] = []
         self.max_events = 10000  # In-memory limit
 
+        # Retained events per agent, oldest first
+        self._events_by_agent: Dict[str, Deque[AuditEvent]] = defaultdict(deque)
+
     def log_event(
         self,
         agent_name: str,
@@ -91,21 +106,22 @@ class AuditLogger:
         )
 
         self.events.append(event)
+        self._events_by_agent[agent_name].append(event)
 
         # Maintain max size
         if len(self.events) > self.max_events:
-            self.events = self.events[-self.max_events :]
-
-        # Log to standard logger
-        log_func = {
-            AuditLevel.DEBUG: self.logger.debug,
-            AuditLevel.INFO: self.logger.info,
-            AuditLevel.WARNING: self.logger.warning,
-            AuditLevel.ERROR: self.logger.error,
-            AuditLevel.CRITICAL: self.logger.critical,
-        }[level]
-
-        log_func(f"[{agent_name}] {action}: {status}")
+            overflow = len(self.events) - self.max_events
+            for dropped in self.events[:overflow]:
+                agent_events = self._events_by_agent[dropped.agent_name]
+                agent_events.popleft()
+                if not agent_events:
+                    del self._events_by_agent[dropped.agent_name]
+            self.events = self.events[overflow:]
+
+        # Log to standard logger, formatting only if the level is enabled
+        log_level = _LOGGING_LEVELS[level]
+        if self.logger.isEnabledFor(log_level):
+            self.logger.log(log_level, "[%s] %s: %s", agent_name, action, status)
 
         return event
 
@@ -115,22 +131,27 @@ class AuditLogger:
         limit: int = 100,
     ) -> List[AuditEvent]:
         """Get audit events."""
-        events = self.events
+        if not agent_name:
+            return self.events[-limit:]
 
-        if agent_name:
-            events = [e for e in events if e.agent_name == agent_name]
+        agent_events = self._events_by_agent.get(agent_name, ())
+
+        # Copy only the requested tail, walking back from the newest event
+        if 0 < limit < len(agent_events):
+            return list(itertools.islice(reversed(agent_events), limit))[::-1]
 
-        return events[-limit:]
+        return list(agent_events)[-limit:]
 
     def clear_events(self) -> None:
         """Clear all events."""
         self.events = []
+        self._events_by_agent.clear()
 
     def get_stats(self, agent_name: Optional[str] = None) -> Dict[str, Any]:
         """Get audit statistics."""
         events = self.events
         if agent_name:
-            events = [e for e in events if e.agent_name == agent_name]
+            events = self._events_by_agent.get(agent_name, ())
 
         if not events:
             return {
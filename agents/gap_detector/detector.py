@@ -3,6 +3,7 @@ Gap Detector Agent - Identify missing data/signals and coverage gaps.
 """
 
 from typing import Any, Dict, List, Optional, Set, Tuple
+from collections import Counter, OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -15,6 +16,47 @@ from core.scoring.risk import ScoringResult
 from agents.base_agent_async import BaseAgentAsync, AgentResult
 from agents.audit_system.audit_logger import AuditLevel
 
+# Base impact of a missing signal type
+_BASE_IMPACT = {
+    "VULNERABILITY": 1.0,
+    "THREAT": 0.9,
+    "INCIDENT": 0.9,
+    "PORT": 0.7,
+    "SERVICE": 0.6,
+    "CONFIGURATION": 0.6,
+    "DNS": 0.5,
+    "SSL_CERTIFICATE": 0.5,
+}
+_DEFAULT_BASE_IMPACT = 0.3
+
+# Entity type modifier applied to the base impact
+_ENTITY_MODIFIERS = {
+    "host": 1.0,
+    "application": 0.9,
+    "domain": 0.8,
+    "network": 0.7,
+}
+_DEFAULT_ENTITY_MODIFIER = 0.5
+
+
+# Gap title/description templates
+_MISSING_SIGNAL_TITLE = "Missing {signal_type} Data"
+_MISSING_SIGNAL_DESC = (
+    "Entity {entity_id} lacks {signal_type} signals which are expected for {entity_type} entities"
+)
+_UNTIMESTAMPED_TITLE = "Untimestamped {signal_type} Data"
+_UNTIMESTAMPED_DESC = "{signal_type} signal from {source} lacks timestamp - cannot assess freshness"
+_STALE_TITLE = "Stale {signal_type} Data"
+_STALE_DESC = "{signal_type} data is {age_hours:.1f} hours old (threshold: {threshold}h)"
+_MISSING_SOURCE_TITLE = "Missing {source} Coverage"
+_MISSING_SOURCE_DESC = "Critical data source {source} is not providing data for this entity"
+_MONITORING_TITLE = "Missing {monitoring_type} Monitoring"
+_MONITORING_DESC = "{entity_type} entity lacks {monitoring_type} monitoring"
+_CORRELATION_TITLE = "Missing {description} Correlation"
+_CORRELATION_DESC = (
+    "Found {trigger_types} signals but missing {expected_types} for complete analysis"
+)
+
 
 class GapType(Enum):
     """Types of gaps that can be detected."""
@@ -44,18 +86,23 @@ class DataGap:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "gap_type": self.gap_type.value,
-            "title": self.title,
-            "description": self.description,
-            "severity": self.severity,
-            "confidence": self.confidence,
-            "entity_id": self.entity_id,
-            "missing_source": self.missing_source,
-            "expected_signals": self.expected_signals,
-            "recommendations": self.recommendations,
-            "impact_score": self.impact_score,
-        }
+        return _gap_to_dict(self)
+
+
+def _gap_to_dict(gap: DataGap) -> Dict[str, Any]:
+    """Convert a gap to dictionary (mapped directly over gap lists)."""
+    return {
+        "gap_type": gap.gap_type.value,
+        "title": gap.title,
+        "description": gap.description,
+        "severity": gap.severity,
+        "confidence": gap.confidence,
+        "entity_id": gap.entity_id,
+        "missing_source": gap.missing_source,
+        "expected_signals": gap.expected_signals,
+        "recommendations": gap.recommendations,
+        "impact_score": gap.impact_score,
+    }
 
 
 @dataclass
@@ -80,7 +127,7 @@ class GapAnalysisResult:
             "high_gaps": self.high_gaps,
             "medium_gaps": self.medium_gaps,
             "low_gaps": self.low_gaps,
-            "gaps": [gap.to_dict() for gap in self.gaps],
+            "gaps": list(map(_gap_to_dict, self.gaps)),
             "coverage_score": self.coverage_score,
             "data_freshness_score": self.data_freshness_score,
             "monitoring_completeness": self.monitoring_completeness,
@@ -98,6 +145,7 @@ class GapDetector(BaseAgentAsync):
         min_coverage_threshold: float = 0.7,
         critical_sources: Optional[Set[str]] = None,
         entity_type_requirements: Optional[Dict[str, List[str]]] = None,
+        cache_size: int = 256,
     ):
         """Initialize gap detector.
 
@@ -108,10 +156,15 @@ class GapDetector(BaseAgentAsync):
             min_coverage_threshold: Minimum coverage threshold
             critical_sources: Set of critical data sources
             entity_type_requirements: Required signals per entity type
+            cache_size: Maximum number of cached analysis results (0 disables caching)
         """
         super().__init__(name, version)
         self.max_data_age_hours = max_data_age_hours
         self.min_coverage_threshold = min_coverage_threshold
+        self.cache_size = cache_size
+
+        # LRU cache of analysis results keyed by entity and signal fingerprint
+        self._cache: "OrderedDict[Tuple, GapAnalysisResult]" = OrderedDict()
 
         # Default critical sources
         self.critical_sources = critical_sources or {
@@ -150,6 +203,19 @@ class GapDetector(BaseAgentAsync):
             ],
         }
 
+        # Required signal types per entity type as frozensets
+        self._entity_req_sets = {
+            entity_type: frozenset(required)
+            for entity_type, required in self.entity_type_requirements.items()
+        }
+
+        # Precomputed (signal_type, entity_type) -> missing-signal impact
+        self._missing_impact = {
+            (signal_type, entity_type): min(1.0, base * modifier)
+            for signal_type, base in _BASE_IMPACT.items()
+            for entity_type, modifier in _ENTITY_MODIFIERS.items()
+        }
+
         # Severity weights
         self.severity_weights = {
             "critical": 1.0,
@@ -174,8 +240,19 @@ class GapDetector(BaseAgentAsync):
             AgentResult with gap analysis
         """
         try:
-            # Perform gap analysis
-            result = await self._detect_gaps(context, scoring_result)
+            # Reuse a cached analysis of an identical context when possible
+            cache_key = self._cache_key(context) if scoring_result is None else None
+            result = self._cache.get(cache_key) if cache_key is not None else None
+
+            if result is None:
+                # Perform gap analysis
+                result = await self._detect_gaps(context, scoring_result)
+                if cache_key is not None:
+                    self._cache[cache_key] = result
+                    if len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+            else:
+                self._cache.move_to_end(cache_key)
 
             # Create agent result
             agent_result = AgentResult(
@@ -200,6 +277,33 @@ class GapDetector(BaseAgentAsync):
                 agent_name=self.name, success=False, error=f"Failed to detect gaps: {str(e)}"
             )
 
+    def _cache_key(self, context: Context) -> Optional[Tuple]:
+        """Build the analysis cache key, or None if the context is not cacheable.
+
+        Signal and current timestamps are bucketed to the hour so a cached
+        result stays valid within that freshness window.
+        """
+        if self.cache_size <= 0 or not context or not context.entity:
+            return None
+
+        signals = Counter(
+            (
+                s.signal_type,
+                s.source,
+                s.entity_id,
+                int(s.timestamp.timestamp()) // 3600 if s.timestamp else None,
+            )
+            for s in context.signals
+        )
+
+        return (
+            context.entity.id,
+            context.entity.entity_type,
+            frozenset(signals.items()),
+            self.max_data_age_hours,
+            int(datetime.utcnow().timestamp()) // 3600,
+        )
+
     async def _detect_gaps(
         self,
         context: Context,
@@ -212,16 +316,39 @@ class GapDetector(BaseAgentAsync):
             # No entity to analyze
             return result
 
+        if not context.signals:
+            # New entity with no signals yet - only coverage, missing-signal and
+            # monitoring gaps can apply, so skip the signal-driven detectors
+            result.gaps.append(self._no_coverage_gap(context))
+            required_signals = self._entity_req_sets.get(context.entity.entity_type, frozenset())
+            self._add_missing_signal_gaps(context, required_signals, result)
+            await self._detect_monitoring_gaps(context, result)
+
+            result.coverage_score = 0.0 if required_signals else 100.0
+            result.data_freshness_score = 0.0
+            result.monitoring_completeness = self._calculate_monitoring_score(context, result)
+            self._update_gap_counts(result)
+
+            return result
+
+        # Shared by the detectors and score calculators below
+        current_types = {s.signal_type for s in context.signals}
+        cutoff_time = datetime.utcnow() - timedelta(hours=self.max_data_age_hours)
+
         # Detect different types of gaps
-        await self._detect_missing_signals(context, result)
-        await self._detect_outdated_data(context, result)
+        await self._detect_missing_signals(context, result, current_types)
+        fresh_signals = await self._detect_outdated_data(context, result, cutoff_time)
         await self._detect_coverage_gaps(context, result)
         await self._detect_monitoring_gaps(context, result)
-        await self._detect_correlation_gaps(context, result)
+        await self._detect_correlation_gaps(context, result, current_types)
 
         # Calculate scores
-        result.coverage_score = self._calculate_coverage_score(context, result)
-        result.data_freshness_score = self._calculate_freshness_score(context)
+        result.coverage_score = self._calculate_coverage_score(
+            context.entity.entity_type, current_types
+        )
+        result.data_freshness_score = self._calculate_freshness_score(
+            fresh_signals, len(context.signals)
+        )
         result.monitoring_completeness = self._calculate_monitoring_score(context, result)
 
         # Update gap counts
@@ -229,22 +356,33 @@ class GapDetector(BaseAgentAsync):
 
         return result
 
-    async def _detect_missing_signals(self, context: Context, result: GapAnalysisResult) -> None:
+    async def _detect_missing_signals(
+        self,
+        context: Context,
+        result: GapAnalysisResult,
+        current_types: Set[str],
+    ) -> None:
         """Detect missing expected signals."""
         if not context.entity or not context.signals:
             return
 
-        entity_type = context.entity.entity_type
-        required_signals = self.entity_type_requirements.get(entity_type, [])
+        required_signals = self._entity_req_sets.get(context.entity.entity_type)
 
         if not required_signals:
             return
 
-        # Get current signal types
-        current_types = {s.signal_type for s in context.signals}
-
         # Find missing signal types
-        missing_types = set(required_signals) - current_types
+        missing_types = required_signals - current_types
+        self._add_missing_signal_gaps(context, missing_types, result)
+
+    def _add_missing_signal_gaps(
+        self,
+        context: Context,
+        missing_types: Set[str],
+        result: GapAnalysisResult,
+    ) -> None:
+        """Add a missing-signal gap for each missing signal type."""
+        entity_type = context.entity.entity_type
 
         for signal_type in missing_types:
             # Determine likely sources for this signal type
@@ -252,8 +390,12 @@ class GapDetector(BaseAgentAsync):
 
             gap = DataGap(
                 gap_type=GapType.MISSING_SIGNAL,
-                title=f"Missing {signal_type} Data",
-                description=f"Entity {context.entity.id} lacks {signal_type} signals which are expected for {entity_type} entities",
+                title=_MISSING_SIGNAL_TITLE.format(signal_type=signal_type),
+                description=_MISSING_SIGNAL_DESC.format(
+                    entity_id=context.entity.id,
+                    signal_type=signal_type,
+                    entity_type=entity_type,
+                ),
                 severity=self._assess_missing_signal_severity(signal_type, entity_type),
                 confidence=0.8,
                 entity_id=context.entity.id,
@@ -267,20 +409,28 @@ class GapDetector(BaseAgentAsync):
 
             result.gaps.append(gap)
 
-    async def _detect_outdated_data(self, context: Context, result: GapAnalysisResult) -> None:
-        """Detect outdated data signals."""
-        if not context.signals:
-            return
+    async def _detect_outdated_data(
+        self,
+        context: Context,
+        result: GapAnalysisResult,
+        cutoff_time: datetime,
+    ) -> int:
+        """Detect outdated data signals.
 
-        cutoff_time = datetime.utcnow() - timedelta(hours=self.max_data_age_hours)
+        Returns:
+            Number of fresh signals, so freshness scoring needs no second scan
+        """
+        fresh_signals = 0
 
         for signal in context.signals:
             if not signal.timestamp:
                 # No timestamp - assume outdated
                 gap = DataGap(
                     gap_type=GapType.OUTDATED_DATA,
-                    title=f"Untimestamped {signal.signal_type} Data",
-                    description=f"{signal.signal_type} signal from {signal.source} lacks timestamp - cannot assess freshness",
+                    title=_UNTIMESTAMPED_TITLE.format(signal_type=signal.signal_type),
+                    description=_UNTIMESTAMPED_DESC.format(
+                        signal_type=signal.signal_type, source=signal.source
+                    ),
                     severity="medium",
                     confidence=0.9,
                     entity_id=signal.entity_id,
@@ -294,48 +444,36 @@ class GapDetector(BaseAgentAsync):
                 result.gaps.append(gap)
                 continue
 
-            if signal.timestamp < cutoff_time:
-                age_hours = (datetime.utcnow() - signal.timestamp).total_seconds() / 3600
+            if signal.timestamp >= cutoff_time:
+                fresh_signals += 1
+                continue
 
-                gap = DataGap(
-                    gap_type=GapType.OUTDATED_DATA,
-                    title=f"Stale {signal.signal_type} Data",
-                    description=f"{signal.signal_type} data is {age_hours:.1f} hours old (threshold: {self.max_data_age_hours}h)",
-                    severity=self._assess_staleness_severity(age_hours, signal.signal_type),
-                    confidence=0.8,
-                    entity_id=signal.entity_id,
-                    missing_source=signal.source,
-                    recommendations=[
-                        f"Update {signal.source} scanning frequency",
-                        f"Schedule more frequent {signal.signal_type} scans",
-                    ],
-                    impact_score=min(1.0, age_hours / (self.max_data_age_hours * 2)),
-                )
-                result.gaps.append(gap)
+            age_hours = (datetime.utcnow() - signal.timestamp).total_seconds() / 3600
 
-    async def _detect_coverage_gaps(self, context: Context, result: GapAnalysisResult) -> None:
-        """Detect coverage gaps in data sources."""
-        if not context.signals:
-            # No signals at all - major coverage gap
             gap = DataGap(
-                gap_type=GapType.COVERAGE_GAP,
-                title="No Data Coverage",
-                description="Entity has no signals - complete lack of visibility",
-                severity="critical",
-                confidence=1.0,
-                entity_id=context.entity.id if context.entity else None,
-                missing_source="all",
-                expected_signals=["VULNERABILITY", "ASSET", "NETWORK"],
+                gap_type=GapType.OUTDATED_DATA,
+                title=_STALE_TITLE.format(signal_type=signal.signal_type),
+                description=_STALE_DESC.format(
+                    signal_type=signal.signal_type,
+                    age_hours=age_hours,
+                    threshold=self.max_data_age_hours,
+                ),
+                severity=self._assess_staleness_severity(age_hours, signal.signal_type),
+                confidence=0.8,
+                entity_id=signal.entity_id,
+                missing_source=signal.source,
                 recommendations=[
-                    "Deploy vulnerability scanner",
-                    "Implement asset inventory",
-                    "Add network monitoring",
+                    f"Update {signal.source} scanning frequency",
+                    f"Schedule more frequent {signal.signal_type} scans",
                 ],
-                impact_score=1.0,
+                impact_score=min(1.0, age_hours / (self.max_data_age_hours * 2)),
             )
             result.gaps.append(gap)
-            return
 
+        return fresh_signals
+
+    async def _detect_coverage_gaps(self, context: Context, result: GapAnalysisResult) -> None:
+        """Detect coverage gaps in data sources."""
         # Check for missing critical sources
         current_sources = {s.source for s in context.signals}
         missing_critical = self.critical_sources - current_sources
@@ -343,8 +481,8 @@ class GapDetector(BaseAgentAsync):
         for source in missing_critical:
             gap = DataGap(
                 gap_type=GapType.COVERAGE_GAP,
-                title=f"Missing {source} Coverage",
-                description=f"Critical data source {source} is not providing data for this entity",
+                title=_MISSING_SOURCE_TITLE.format(source=source),
+                description=_MISSING_SOURCE_DESC.format(source=source),
                 severity="high",
                 confidence=0.9,
                 entity_id=context.entity.id if context.entity else None,
@@ -357,6 +495,25 @@ class GapDetector(BaseAgentAsync):
             )
             result.gaps.append(gap)
 
+    def _no_coverage_gap(self, context: Context) -> DataGap:
+        """Build the coverage gap for an entity with no signals."""
+        return DataGap(
+            gap_type=GapType.COVERAGE_GAP,
+            title="No Data Coverage",
+            description="Entity has no signals - complete lack of visibility",
+            severity="critical",
+            confidence=1.0,
+            entity_id=context.entity.id if context.entity else None,
+            missing_source="all",
+            expected_signals=["VULNERABILITY", "ASSET", "NETWORK"],
+            recommendations=[
+                "Deploy vulnerability scanner",
+                "Implement asset inventory",
+                "Add network monitoring",
+            ],
+            impact_score=1.0,
+        )
+
     async def _detect_monitoring_gaps(self, context: Context, result: GapAnalysisResult) -> None:
         """Detect monitoring completeness gaps."""
         if not context.entity:
@@ -382,8 +539,10 @@ class GapDetector(BaseAgentAsync):
         for monitoring_type in missing_monitoring:
             gap = DataGap(
                 gap_type=GapType.MONITORING_GAP,
-                title=f"Missing {monitoring_type.title()} Monitoring",
-                description=f"{entity_type} entity lacks {monitoring_type} monitoring",
+                title=_MONITORING_TITLE.format(monitoring_type=monitoring_type.title()),
+                description=_MONITORING_DESC.format(
+                    entity_type=entity_type, monitoring_type=monitoring_type
+                ),
                 severity="medium",
                 confidence=0.7,
                 entity_id=context.entity.id,
@@ -394,7 +553,12 @@ class GapDetector(BaseAgentAsync):
             )
             result.gaps.append(gap)
 
-    async def _detect_correlation_gaps(self, context: Context, result: GapAnalysisResult) -> None:
+    async def _detect_correlation_gaps(
+        self,
+        context: Context,
+        result: GapAnalysisResult,
+        current_types: Set[str],
+    ) -> None:
         """Detect correlation gaps between related signals."""
         if not context.signals or len(context.signals) < 2:
             return
@@ -418,8 +582,6 @@ class GapDetector(BaseAgentAsync):
             },
         ]
 
-        current_types = {s.signal_type for s in context.signals}
-
         for rule in correlation_rules:
             if any(t in current_types for t in rule["trigger_types"]):
                 missing_correlations = set(rule["expected_types"]) - current_types
@@ -427,8 +589,11 @@ class GapDetector(BaseAgentAsync):
                 if missing_correlations:
                     gap = DataGap(
                         gap_type=GapType.CORRELATION_GAP,
-                        title=f"Missing {rule['description']} Correlation",
-                        description=f"Found {rule['trigger_types']} signals but missing {rule['expected_types']} for complete analysis",
+                        title=_CORRELATION_TITLE.format(description=rule["description"]),
+                        description=_CORRELATION_DESC.format(
+                            trigger_types=rule["trigger_types"],
+                            expected_types=rule["expected_types"],
+                        ),
                         severity="low",
                         confidence=0.6,
                         entity_id=context.entity.id if context.entity else None,
@@ -571,30 +736,14 @@ class GapDetector(BaseAgentAsync):
 
     def _calculate_missing_impact(self, signal_type: str, entity_type: str) -> float:
         """Calculate impact score for missing signal."""
-        base_impact = {
-            "VULNERABILITY": 1.0,
-            "THREAT": 0.9,
-            "INCIDENT": 0.9,
-            "PORT": 0.7,
-            "SERVICE": 0.6,
-            "CONFIGURATION": 0.6,
-            "DNS": 0.5,
-            "SSL_CERTIFICATE": 0.5,
-        }
-
-        impact = base_impact.get(signal_type, 0.3)
-
-        # Entity type modifier
-        entity_modifiers = {
-            "host": 1.0,
-            "application": 0.9,
-            "domain": 0.8,
-            "network": 0.7,
-        }
-
-        modifier = entity_modifiers.get(entity_type, 0.5)
-
-        return min(1.0, impact * modifier)
+        impact = self._missing_impact.get((signal_type, entity_type))
+        if impact is None:
+            impact = min(
+                1.0,
+                _BASE_IMPACT.get(signal_type, _DEFAULT_BASE_IMPACT)
+                * _ENTITY_MODIFIERS.get(entity_type, _DEFAULT_ENTITY_MODIFIER),
+            )
+        return impact
 
     def _infer_monitoring_from_signals(self, signals: List[Signal]) -> Set[str]:
         """Infer current monitoring from available signals."""
@@ -616,38 +765,23 @@ class GapDetector(BaseAgentAsync):
 
         return monitoring_types
 
-    def _calculate_coverage_score(self, context: Context, result: GapAnalysisResult) -> float:
+    def _calculate_coverage_score(self, entity_type: str, current_types: Set[str]) -> float:
         """Calculate data coverage score (0-100)."""
-        if not context.entity:
-            return 0.0
-
-        entity_type = context.entity.entity_type
-        required_signals = self.entity_type_requirements.get(entity_type, [])
+        required_signals = self._entity_req_sets.get(entity_type)
 
         if not required_signals:
             return 100.0  # No requirements = full coverage
 
-        if not context.signals:
-            return 0.0
-
-        current_types = {s.signal_type for s in context.signals}
-        coverage = len(current_types & set(required_signals)) / len(required_signals)
+        coverage = len(current_types & required_signals) / len(required_signals)
 
         return coverage * 100.0
 
-    def _calculate_freshness_score(self, context: Context) -> float:
+    def _calculate_freshness_score(self, fresh_signals: int, total_signals: int) -> float:
         """Calculate data freshness score (0-100)."""
-        if not context.signals:
+        if not total_signals:
             return 0.0
 
-        cutoff_time = datetime.utcnow() - timedelta(hours=self.max_data_age_hours)
-        fresh_signals = 0
-
-        for signal in context.signals:
-            if signal.timestamp and signal.timestamp >= cutoff_time:
-                fresh_signals += 1
-
-        return (fresh_signals / len(context.signals)) * 100.0
+        return (fresh_signals / total_signals) * 100.0
 
     def _calculate_monitoring_score(self, context: Context, result: GapAnalysisResult) -> float:
         """Calculate monitoring completeness score (0-100)."""
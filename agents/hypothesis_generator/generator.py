@@ -2,10 +2,18 @@
 Hypothesis Generator Agent - Suggest likely security issues and attack scenarios.
 """
 
-from typing import Any, Dict, List, Optional, Set, Tuple
-from dataclasses import dataclass, field
+from collections import Counter
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Sequence, Set, Tuple
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
+import asyncio
+import bisect
+import heapq
+import itertools
 import re
 import random
 
@@ -42,7 +50,37 @@ class ConfidenceLevel(Enum):
     VERY_HIGH = "very_high"
 
 
-@dataclass
+# Confidence levels from lowest to highest; a level's rank is its index
+_CONFIDENCE_ORDER = (
+    ConfidenceLevel.VERY_LOW,
+    ConfidenceLevel.LOW,
+    ConfidenceLevel.MEDIUM,
+    ConfidenceLevel.HIGH,
+    ConfidenceLevel.VERY_HIGH,
+)
+_CONFIDENCE_RANKS = {level: rank for rank, level in enumerate(_CONFIDENCE_ORDER)}
+_HIGH_CONFIDENCE_RANK = _CONFIDENCE_RANKS[ConfidenceLevel.HIGH]
+_MEDIUM_CONFIDENCE_RANK = _CONFIDENCE_RANKS[ConfidenceLevel.MEDIUM]
+
+# Numeric weight per confidence rank, used for filtering and ranking
+_CONFIDENCE_WEIGHTS = (0.2, 0.4, 0.6, 0.8, 1.0)
+
+# Lower bounds of the LOW..VERY_HIGH confidence ranks for rule confidence
+# and for risk scores (0-100)
+_RULE_CONFIDENCE_THRESHOLDS = (0.3, 0.5, 0.7, 0.9)
+_SCORE_CONFIDENCE_THRESHOLDS = (40, 60, 80, 90)
+
+# Numeric rank per signal severity
+_SEVERITY_LEVELS = {"critical": 5, "high": 4, "medium": 3, "low": 2, "info": 1}
+
+# Signal ID accessor for supporting-signal lists
+_signal_id = attrgetter("id")
+
+# Ranking weight per impact level
+_IMPACT_WEIGHTS = {"critical": 3, "high": 2, "medium": 1, "low": 0}
+
+
+@dataclass(slots=True)
 class Hypothesis:
     """Security hypothesis with supporting evidence."""
 
@@ -60,6 +98,21 @@ class Hypothesis:
     related_entities: List[str] = field(default_factory=list)
     time_to_compromise: Optional[str] = None
     detection_difficulty: str = "medium"  # easy/medium/hard
+    _sort_key: Tuple[float, int, float] = field(init=False, repr=False, compare=False)
+    _type_value: str = field(init=False, repr=False, compare=False)
+    _confidence_value: str = field(init=False, repr=False, compare=False)
+    _confidence_rank: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Cache the ranking key, confidence rank and serialized enum values."""
+        self._type_value = self.hypothesis_type.value
+        self._confidence_value = self.confidence.value
+        self._confidence_rank = _CONFIDENCE_RANKS[self.confidence]
+        self._sort_key = (
+            _CONFIDENCE_WEIGHTS[self._confidence_rank],
+            _IMPACT_WEIGHTS.get(self.impact, 0),
+            self.likelihood,
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -67,8 +120,8 @@ class Hypothesis:
             "id": self.id,
             "title": self.title,
             "description": self.description,
-            "hypothesis_type": self.hypothesis_type.value,
-            "confidence": self.confidence.value,
+            "hypothesis_type": self._type_value,
+            "confidence": self._confidence_value,
             "likelihood": self.likelihood,
             "impact": self.impact,
             "supporting_signals": self.supporting_signals,
@@ -81,7 +134,15 @@ class Hypothesis:
         }
 
 
-@dataclass
+@dataclass(slots=True)
+class _SignalIndex:
+    """Signals of one analysis bucketed by type in a single pass."""
+
+    types: FrozenSet[str]
+    by_type: Dict[str, List[Signal]]
+
+
+@dataclass(slots=True)
 class HypothesisAnalysis:
     """Complete hypothesis analysis result."""
 
@@ -112,6 +173,290 @@ class HypothesisAnalysis:
         }
 
 
+# Common attack chain patterns
+_ATTACK_CHAIN_PATTERNS = tuple(
+    MappingProxyType({**pattern, "signal_types": frozenset(pattern["signal_sequence"])})
+    for pattern in (
+        {
+            "name": "Reconnaissance to Exploitation",
+            "description": "Discovery followed by vulnerability exploitation",
+            "signal_sequence": ("DNS", "SUBDOMAIN", "PORT", "VULNERABILITY"),
+            "steps": (
+                "DNS reconnaissance",
+                "Subdomain enumeration",
+                "Port scanning",
+                "Vulnerability discovery",
+                "Exploitation",
+            ),
+            "time_to_compromise": "hours",
+        },
+        {
+            "name": "Lateral Movement",
+            "description": "Movement between compromised systems",
+            "signal_sequence": ("AUTHENTICATION", "PRIVILEGE_ESCALATION", "LATERAL"),
+            "steps": (
+                "Initial compromise",
+                "Credential theft",
+                "Privilege escalation",
+                "Lateral movement",
+            ),
+            "time_to_compromise": "days",
+        },
+    )
+)
+
+# Creative hypothesis patterns, fired when any trigger signal type is present
+_CREATIVE_PATTERNS = tuple(
+    MappingProxyType({**pattern, "trigger_types": frozenset(pattern["triggers"])})
+    for pattern in (
+        {
+            "type": HypothesisType.SUPPLY_CHAIN,
+            "triggers": ("DEPENDENCY", "THIRD_PARTY"),
+            "title": "Supply Chain Compromise",
+            "description": "Entity may be compromised through trusted supply chain relationships",
+        },
+        {
+            "type": HypothesisType.INSIDER_THREAT,
+            "triggers": ("ACCESS_LOG", "PRIVILEGE_ESCALATION"),
+            "title": "Potential Insider Threat",
+            "description": "Unusual access patterns suggest potential insider threat activity",
+        },
+        {
+            "type": HypothesisType.RANSOMWARE,
+            "triggers": ("ENCRYPTION", "FILE_ACCESS"),
+            "title": "Ransomware Attack Preparation",
+            "description": "Signals indicate potential ransomware attack preparation phase",
+        },
+    )
+)
+
+# Attack steps per creative hypothesis type
+_STEP_TEMPLATES = MappingProxyType(
+    {
+        HypothesisType.SUPPLY_CHAIN: (
+            "Compromise trusted supplier",
+            "Inject malicious code/components",
+            "Distribute through legitimate channels",
+            "Exploit trust relationships",
+        ),
+        HypothesisType.INSIDER_THREAT: (
+            "Abuse legitimate access",
+            "Exfiltrate sensitive data",
+            "Cover tracks or maintain access",
+            "Escalate privileges if needed",
+        ),
+        HypothesisType.RANSOMWARE: (
+            "Initial access through phishing/vulnerability",
+            "Deploy ransomware payload",
+            "Encrypt critical files",
+            "Demand ransom payment",
+        ),
+    }
+)
+
+# Mitigations per creative hypothesis type
+_MITIGATION_TEMPLATES = MappingProxyType(
+    {
+        HypothesisType.SUPPLY_CHAIN: (
+            "Implement software composition analysis",
+            "Verify supplier security practices",
+            "Monitor third-party dependencies",
+            "Establish secure development practices",
+        ),
+        HypothesisType.INSIDER_THREAT: (
+            "Implement principle of least privilege",
+            "Monitor user behavior analytics",
+            "Conduct regular access reviews",
+            "Implement data loss prevention",
+        ),
+        HypothesisType.RANSOMWARE: (
+            "Regular offline backups",
+            "Network segmentation",
+            "Email security and awareness training",
+            "Endpoint detection and response",
+        ),
+    }
+)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Hypothesis generation rules per signal type, shared by all generators
+_HYPOTHESIS_RULES = _freeze(
+    {
+        "VULNERABILITY": [
+            {
+                "hypothesis_type": "vulnerability_exploitation",
+                "title": "Vulnerability Exploitation Attempt",
+                "description": "Critical vulnerabilities may be actively exploited",
+                "min_severity": "critical",
+                "likelihood": 0.8,
+                "impact": "critical",
+                "attack_steps": [
+                    "Vulnerability discovery",
+                    "Exploit development/acquisition",
+                    "Exploitation attempt",
+                    "Post-exploitation activities",
+                ],
+                "mitigations": [
+                    "Immediate patching",
+                    "Virtual patching",
+                    "Network isolation",
+                    "Increased monitoring",
+                ],
+                "time_to_compromise": "hours",
+                "detection_difficulty": "medium",
+            },
+        ],
+        "PORT": [
+            {
+                "hypothesis_type": "lateral_movement",
+                "title": "Lateral Movement Pathway",
+                "description": "Open ports may facilitate lateral movement",
+                "min_signals": 3,
+                "likelihood": 0.6,
+                "impact": "high",
+                "attack_steps": [
+                    "Network reconnaissance",
+                    "Port scanning",
+                    "Service identification",
+                    "Exploitation",
+                    "Lateral movement",
+                ],
+                "mitigations": [
+                    "Close unnecessary ports",
+                    "Implement network segmentation",
+                    "Port knocking",
+                    "Intrusion detection",
+                ],
+                "time_to_compromise": "days",
+                "detection_difficulty": "medium",
+            },
+        ],
+        "DNS": [
+            {
+                "hypothesis_type": "data_exfiltration",
+                "title": "DNS-based Data Exfiltration",
+                "description": "DNS queries may be used for data exfiltration",
+                "pattern": "exfil",
+                "likelihood": 0.5,
+                "impact": "high",
+                "attack_steps": [
+                    "Establish C2 via DNS",
+                    "Encode data in DNS queries",
+                    "Exfiltrate data slowly",
+                    "Avoid detection",
+                ],
+                "mitigations": [
+                    "DNS monitoring",
+                    "Query analysis",
+                    "DNS filtering",
+                    "Traffic analysis",
+                ],
+                "time_to_compromise": "weeks",
+                "detection_difficulty": "hard",
+            },
+        ],
+    }
+)
+
+# Attack patterns and TTPs per tactic
+_ATTACK_PATTERNS = _freeze(
+    {
+        "reconnaissance": ["dns_query", "port_scan", "service_enum"],
+        "initial_access": ["phishing", "exploit", "valid_accounts"],
+        "execution": ["command_line", "scripts", "signed_binary"],
+        "persistence": ["scheduled_tasks", "services", "registry"],
+        "privilege_escalation": ["process_injection", "access_token_manipulation"],
+        "defense_evasion": ["obfuscation", "rootkit", "code_signing"],
+        "credential_access": ["brute_force", "credential_dumping"],
+        "discovery": ["system_info", "network_shares", "process_discovery"],
+        "lateral_movement": ["remote_services", "remote_execution", "smb"],
+        "collection": ["data_from_local_system", "data_staged"],
+        "exfiltration": ["exfiltration_over_c2", "exfiltration_over_web"],
+        "impact": ["data_encryption", "service_stop", "data_destruction"],
+    }
+)
+
+
+@lru_cache(maxsize=4096)
+def _matching_attack_chains(signal_types: FrozenSet[str]) -> Tuple[int, ...]:
+    """Return indices of the attack chain patterns matched by a set of signal types.
+
+    A chain matches when at least 3 of its signal types are present. Results
+    are memoized since the same signal-type combinations recur across analyses.
+    """
+    return tuple(
+        index
+        for index, pattern in enumerate(_ATTACK_CHAIN_PATTERNS)
+        if len(signal_types & pattern["signal_types"]) >= 3
+    )
+
+
+@lru_cache(maxsize=None)
+def _rule_confidence(
+    base_confidence: float, signal_count: int, max_severity: int
+) -> ConfidenceLevel:
+    """Confidence level of a matched rule.
+
+    Inputs come from a small discrete domain (rule base confidence, signal
+    count up to saturation, severity rank), so results are memoized.
+    """
+    # Boost confidence based on signal quality
+    signal_boost = min(0.3, signal_count * 0.1)
+
+    # Boost confidence based on severity
+    severity_boost = max_severity * 0.1
+
+    total_confidence = base_confidence + signal_boost + severity_boost
+
+    # Convert to confidence level
+    return _CONFIDENCE_ORDER[bisect.bisect_right(_RULE_CONFIDENCE_THRESHOLDS, total_confidence)]
+
+
+def _attack_surface_score(high_impact: int, high_confidence: int, total: int) -> float:
+    """Attack surface score (0-100) from high-impact and high-confidence shares."""
+    return (high_impact / total * 0.6 + high_confidence / total * 0.4) * 100
+
+
+# Rule predicate: (signals, matched patterns, max severity) -> match
+_RulePredicate = Callable[[List[Signal], Set[str], int], bool]
+
+
+def _compile_rule_predicate(rule: Mapping[str, Any]) -> _RulePredicate:
+    """Specialize a hypothesis rule into a predicate over a signal group.
+
+    Only the checks the rule actually declares are kept, with their
+    thresholds bound as constants.
+    """
+    min_signals = rule.get("min_signals", 0)
+    min_severity = _SEVERITY_LEVELS.get(rule["min_severity"], 0) if "min_severity" in rule else 0
+    pattern = rule.get("pattern")
+
+    if pattern is None:
+
+        def predicate(signals: List[Signal], matched_patterns: Set[str], max_severity: int) -> bool:
+            return len(signals) >= min_signals and max_severity >= min_severity
+
+    else:
+
+        def predicate(signals: List[Signal], matched_patterns: Set[str], max_severity: int) -> bool:
+            return (
+                len(signals) >= min_signals
+                and max_severity >= min_severity
+                and pattern in matched_patterns
+            )
+
+    return predicate
+
+
 class HypothesisGenerator(BaseAgentAsync):
     """Agent that generates security hypotheses based on available data."""
 
@@ -140,9 +485,24 @@ class HypothesisGenerator(BaseAgentAsync):
         self.enable_creative_hypotheses = enable_creative_hypotheses
         self.threat_intelligence_weight = threat_intelligence_weight
 
+        # Hypothesis ID generation: one timestamp per analysis plus a counter
+        self._id_counter = itertools.count()
+        self._current_ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+
         # Hypothesis generation rules
         self.hypothesis_rules = self._initialize_hypothesis_rules()
 
+        # Rules specialized into predicates, per signal type
+        self._rule_predicates = self._compile_rule_predicates(self.hypothesis_rules)
+
+        # Single matcher over all rule description patterns
+        self._pattern_matcher, self._pattern_closure = self._compile_rule_patterns(
+            self.hypothesis_rules
+        )
+
+        # Prebuilt creative hypotheses, stamped with an ID per analysis
+        self._creative_templates = self._build_creative_templates()
+
         # Attack patterns and TTPs
         self.attack_patterns = self._initialize_attack_patterns()
 
@@ -208,13 +568,31 @@ class HypothesisGenerator(BaseAgentAsync):
         if not context.entity:
             return analysis
 
-        # Generate hypotheses from different sources
-        await self._generate_signal_based_hypotheses(context, analysis)
-        await self._generate_entity_based_hypotheses(context, analysis)
-        await self._generate_scoring_based_hypotheses(scoring_result, analysis)
+        self._current_ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+
+        # Index signals once for all signal-driven generators
+        signal_index = self._index_signals(context.signals) if context.signals else None
+
+        # Generate hypotheses from the independent sources concurrently,
+        # skipping sources that have no input
+        generators = []
+
+        if signal_index is not None:
+            generators.append(self._generate_signal_based_hypotheses(context, signal_index))
 
-        if self.enable_creative_hypotheses:
-            await self._generate_creative_hypotheses(context, analysis)
+        generators.append(self._generate_entity_based_hypotheses(context))
+
+        if scoring_result is not None:
+            generators.append(self._generate_scoring_based_hypotheses(scoring_result))
+
+        if signal_index is not None and self.enable_creative_hypotheses:
+            generators.append(self._generate_creative_hypotheses(signal_index))
+
+        results = await asyncio.gather(*generators)
+        analysis.hypotheses = list(itertools.chain.from_iterable(results))
+
+        if not analysis.hypotheses:
+            return analysis
 
         # Sort and filter hypotheses
         analysis.hypotheses = self._filter_and_sort_hypotheses(analysis.hypotheses)
@@ -228,57 +606,61 @@ class HypothesisGenerator(BaseAgentAsync):
         return analysis
 
     async def _generate_signal_based_hypotheses(
-        self, context: Context, analysis: HypothesisAnalysis
-    ) -> None:
+        self, context: Context, signal_index: "_SignalIndex"
+    ) -> List[Hypothesis]:
         """Generate hypotheses based on signal patterns."""
+        hypotheses = []
+
         if not context.signals:
-            return
+            return hypotheses
 
-        # Group signals by type and severity
-        signal_groups = self._group_signals(context.signals)
+        # Generate hypotheses for each signal pattern that has rules
+        for signal_type, signals in signal_index.by_type.items():
+            if signal_type not in self.hypothesis_rules:
+                continue
 
-        # Generate hypotheses for each signal pattern
-        for signal_type, signals in signal_groups.items():
-            hypotheses = await self._analyze_signal_pattern(signal_type, signals, context)
-            analysis.hypotheses.extend(hypotheses)
+            max_severity = self._max_severity(signals)
+            hypotheses.extend(
+                await self._analyze_signal_pattern(signal_type, signals, context, max_severity)
+            )
 
         # Generate correlation hypotheses
-        correlation_hypotheses = await self._generate_correlation_hypotheses(
-            context.signals, context
+        hypotheses.extend(
+            await self._generate_correlation_hypotheses(context.signals, signal_index.types)
         )
-        analysis.hypotheses.extend(correlation_hypotheses)
 
-    async def _generate_entity_based_hypotheses(
-        self, context: Context, analysis: HypothesisAnalysis
-    ) -> None:
+        return hypotheses
+
+    async def _generate_entity_based_hypotheses(self, context: Context) -> List[Hypothesis]:
         """Generate hypotheses based on entity characteristics."""
         entity = context.entity
 
         if not entity:
-            return
+            return []
 
         # Entity type-based hypotheses
-        entity_hypotheses = await self._analyze_entity_characteristics(entity, context)
-        analysis.hypotheses.extend(entity_hypotheses)
+        hypotheses = await self._analyze_entity_characteristics(entity, context)
 
         # Entity property-based hypotheses
         if entity.properties:
-            property_hypotheses = await self._analyze_entity_properties(entity, context)
-            analysis.hypotheses.extend(property_hypotheses)
+            hypotheses.extend(await self._analyze_entity_properties(entity, context))
+
+        return hypotheses
 
     async def _generate_scoring_based_hypotheses(
         self,
         scoring_result: Optional[ScoringResult],
-        analysis: HypothesisAnalysis,
-    ) -> None:
+    ) -> List[Hypothesis]:
         """Generate hypotheses based on scoring results."""
+        hypotheses = []
+
         if not scoring_result:
-            return
+            return hypotheses
 
         # High score hypotheses
         if scoring_result.score >= 70:
             hypothesis = Hypothesis(
-                id=f"high_score_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
+                id=self._hypothesis_id("high_score"),
                 title=f"High Risk Score Indicates Active Threat",
                 description=f"Entity scored {scoring_result.score}/100 suggesting active security issues requiring immediate attention",
                 hypothesis_type=HypothesisType.ADVANCED_PERSISTENT_THREAT,
@@ -299,101 +681,134 @@ class HypothesisGenerator(BaseAgentAsync):
                 time_to_compromise="Unknown - likely already compromised",
                 detection_difficulty="hard",
             )
-            analysis.hypotheses.append(hypothesis)
+            hypotheses.append(hypothesis)
 
-    async def _generate_creative_hypotheses(
-        self, context: Context, analysis: HypothesisAnalysis
-    ) -> None:
+        return hypotheses
+
+    async def _generate_creative_hypotheses(self, signal_index: "_SignalIndex") -> List[Hypothesis]:
         """Generate creative/advanced security hypotheses."""
-        creative_patterns = [
-            {
-                "type": HypothesisType.SUPPLY_CHAIN,
-                "triggers": ["DEPENDENCY", "THIRD_PARTY"],
-                "title": "Supply Chain Compromise",
-                "description": "Entity may be compromised through trusted supply chain relationships",
-            },
-            {
-                "type": HypothesisType.INSIDER_THREAT,
-                "triggers": ["ACCESS_LOG", "PRIVILEGE_ESCALATION"],
-                "title": "Potential Insider Threat",
-                "description": "Unusual access patterns suggest potential insider threat activity",
-            },
-            {
-                "type": HypothesisType.RANSOMWARE,
-                "triggers": ["ENCRYPTION", "FILE_ACCESS"],
-                "title": "Ransomware Attack Preparation",
-                "description": "Signals indicate potential ransomware attack preparation phase",
-            },
-        ]
+        hypotheses = []
+
+        signal_types = signal_index.types
+
+        for trigger_types, id_prefix, template in self._creative_templates:
+            if not trigger_types.isdisjoint(signal_types):
+                hypothesis = replace(
+                    template,
+                    id=self._hypothesis_id(id_prefix),
+                    supporting_signals=list(template.supporting_signals),
+                    missing_evidence=list(template.missing_evidence),
+                    attack_steps=list(template.attack_steps),
+                    mitigations=list(template.mitigations),
+                    related_entities=list(template.related_entities),
+                )
+                hypotheses.append(hypothesis)
+
+        return hypotheses
+
+    def _build_creative_templates(self) -> List[Tuple[FrozenSet[str], str, Hypothesis]]:
+        """Build a template hypothesis per creative pattern.
 
-        for pattern in creative_patterns:
-            if self._has_trigger_signals(context.signals, pattern["triggers"]):
-                hypothesis = Hypothesis(
-                    id=f"creative_{pattern['type'].value}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
+        Returns:
+            (trigger types, ID prefix, template) per pattern; templates carry
+            an empty ID and their list fields are copied for every hypothesis
+        """
+        return [
+            (
+                pattern["trigger_types"],
+                f"creative_{pattern['type'].value}",
+                Hypothesis(
+                    id="",
                     title=pattern["title"],
                     description=pattern["description"],
                     hypothesis_type=pattern["type"],
                     confidence=ConfidenceLevel.MEDIUM,
                     likelihood=0.4,
                     impact="high",
-                    supporting_signals=pattern["triggers"],
+                    supporting_signals=list(pattern["triggers"]),
                     attack_steps=self._generate_attack_steps(pattern["type"]),
                     mitigations=self._generate_mitigations(pattern["type"]),
                     detection_difficulty="medium",
-                )
-                analysis.hypotheses.append(hypothesis)
+                ),
+            )
+            for pattern in _CREATIVE_PATTERNS
+        ]
+
+    def _hypothesis_id(self, prefix: str) -> str:
+        """Build a unique hypothesis ID from the current analysis timestamp."""
+        return f"{prefix}_{self._current_ts}_{next(self._id_counter)}"
+
+    def _index_signals(self, signals: List[Signal]) -> "_SignalIndex":
+        """Bucket signals by type in a single pass."""
+        by_type: Dict[str, List[Signal]] = {}
 
-    def _group_signals(self, signals: List[Signal]) -> Dict[str, List[Signal]]:
-        """Group signals by type."""
-        groups = {}
         for signal in signals:
-            if signal.signal_type not in groups:
-                groups[signal.signal_type] = []
-            groups[signal.signal_type].append(signal)
-        return groups
+            bucket = by_type.get(signal.signal_type)
+            if bucket is None:
+                bucket = by_type[signal.signal_type] = []
+            bucket.append(signal)
+
+        return _SignalIndex(types=frozenset(by_type), by_type=by_type)
 
     async def _analyze_signal_pattern(
         self,
         signal_type: str,
         signals: List[Signal],
         context: Context,
+        max_severity: int,
     ) -> List[Hypothesis]:
         """Analyze specific signal pattern for hypotheses."""
         hypotheses = []
 
-        # Get hypothesis rules for this signal type
-        rules = self.hypothesis_rules.get(signal_type, [])
+        # Get compiled hypothesis rules for this signal type
+        uses_patterns, rules = self._rule_predicates.get(signal_type, (False, []))
 
-        for rule in rules:
-            if self._matches_rule(signals, rule):
-                hypothesis = await self._create_hypothesis_from_rule(rule, signals, context)
+        # Rule patterns found in this group's descriptions, in one sweep
+        matched_patterns = self._match_patterns(signals) if uses_patterns else set()
+
+        for rule, predicate in rules:
+            if predicate(signals, matched_patterns, max_severity):
+                hypothesis = await self._create_hypothesis_from_rule(
+                    rule, signals, context, max_severity
+                )
                 if hypothesis:
                     hypotheses.append(hypothesis)
 
         return hypotheses
 
+    def _max_severity(self, signals: List[Signal]) -> int:
+        """Highest severity rank in a signal group.
+
+        Severity strings repeat heavily, so only the distinct values are
+        lowercased and ranked.
+        """
+        return max(
+            _SEVERITY_LEVELS.get(severity.lower(), 0)
+            for severity in set(map(attrgetter("severity"), signals))
+        )
+
     async def _generate_correlation_hypotheses(
         self,
         signals: List[Signal],
-        context: Context,
+        signal_types: FrozenSet[str],
     ) -> List[Hypothesis]:
         """Generate hypotheses from signal correlations."""
         hypotheses = []
 
         # Look for attack chains
-        attack_chains = self._identify_attack_chains(signals)
+        attack_chains = self._identify_attack_chains(signals, signal_types)
 
         for chain in attack_chains:
             hypothesis = Hypothesis(
-                id=f"attack_chain_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
+                id=self._hypothesis_id("attack_chain"),
                 title=f"Attack Chain Detected: {chain['name']}",
                 description=f"Signals indicate progression through attack chain: {chain['description']}",
                 hypothesis_type=HypothesisType.ADVANCED_PERSISTENT_THREAT,
                 confidence=ConfidenceLevel.HIGH,
                 likelihood=0.8,
                 impact="critical",
-                supporting_signals=[s.id for s in chain["signals"]],
-                attack_steps=chain["steps"],
+                supporting_signals=list(map(_signal_id, chain["signals"])),
+                attack_steps=list(chain["steps"]),
                 mitigations=[
                     "Break the attack chain at earliest possible step",
                     "Implement detection for each attack stage",
@@ -415,7 +830,7 @@ class HypothesisGenerator(BaseAgentAsync):
         # Critical entity hypotheses
         if entity.entity_type in {"host", "application", "database"}:
             hypothesis = Hypothesis(
-                id=f"critical_entity_{entity.id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
+                id=self._hypothesis_id(f"critical_entity_{entity.id}"),
                 title=f"Critical Asset Targeting",
                 description=f"{entity.entity_type} '{entity.name}' is a critical asset likely to be targeted by attackers",
                 hypothesis_type=HypothesisType.ADVANCED_PERSISTENT_THREAT,
@@ -454,7 +869,7 @@ class HypothesisGenerator(BaseAgentAsync):
         # Public-facing assets
         if props.get("public", False) or props.get("exposed", False):
             hypothesis = Hypothesis(
-                id=f"public_exposure_{entity.id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
+                id=self._hypothesis_id(f"public_exposure_{entity.id}"),
                 title="Public-Facing Asset Attack Surface",
                 description="Public-facing exposure increases attack surface and risk of direct attacks",
                 hypothesis_type=HypothesisType.VULNERABILITY_EXPLOITATION,
@@ -481,386 +896,203 @@ class HypothesisGenerator(BaseAgentAsync):
 
         return hypotheses
 
-    def _matches_rule(self, signals: List[Signal], rule: Dict[str, Any]) -> bool:
-        """Check if signals match hypothesis rule."""
-        # Check signal count
-        if "min_signals" in rule and len(signals) < rule["min_signals"]:
-            return False
-
-        # Check severity requirements
-        if "min_severity" in rule:
-            severity_levels = {"critical": 5, "high": 4, "medium": 3, "low": 2, "info": 1}
-            max_severity = max(severity_levels.get(s.severity.lower(), 0) for s in signals)
-            required_level = severity_levels.get(rule["min_severity"], 0)
-            if max_severity < required_level:
-                return False
-
-        # Check specific patterns
-        if "pattern" in rule:
-            pattern = rule["pattern"]
-            for signal in signals:
-                if pattern in signal.description.lower():
-                    return True
-            return False
-
-        return True
+    def _compile_rule_predicates(
+        self, rules: Mapping[str, Sequence[Mapping[str, Any]]]
+    ) -> Dict[str, Tuple[bool, List[Tuple[Mapping[str, Any], _RulePredicate]]]]:
+        """Compile each rule into a predicate.
+
+        Returns:
+            Map from signal type to whether any of its rules uses a pattern,
+            and its (rule, predicate) pairs
+        """
+        return {
+            signal_type: (
+                any("pattern" in rule for rule in group),
+                [(rule, _compile_rule_predicate(rule)) for rule in group],
+            )
+            for signal_type, group in rules.items()
+        }
+
+    def _compile_rule_patterns(
+        self, rules: Mapping[str, Sequence[Mapping[str, Any]]]
+    ) -> Tuple[Optional["re.Pattern[str]"], Dict[str, Set[str]]]:
+        """Compile all rule patterns into a single matcher.
+
+        Patterns are tried longest first at every position, so each match is
+        expanded to every pattern it contains to catch overlapping patterns.
+
+        Returns:
+            Compiled matcher (None if no rule has a pattern) and a map from each
+            pattern to the set of patterns it contains
+        """
+        patterns = sorted(
+            {rule["pattern"] for group in rules.values() for rule in group if "pattern" in rule},
+            key=len,
+            reverse=True,
+        )
+
+        if not patterns:
+            return None, {}
+
+        matcher = re.compile("(?=(" + "|".join(map(re.escape, patterns)) + "))")
+        closure = {p: {q for q in patterns if q in p} for p in patterns}
+
+        return matcher, closure
+
+    def _match_patterns(self, signals: List[Signal]) -> Set[str]:
+        """Find the rule patterns present in any of the signal descriptions."""
+        matched: Set[str] = set()
+
+        if self._pattern_matcher is None:
+            return matched
+
+        for signal in signals:
+            for match in self._pattern_matcher.finditer((signal.description or "").lower()):
+                matched |= self._pattern_closure[match.group(1)]
+
+        return matched
 
     async def _create_hypothesis_from_rule(
         self,
-        rule: Dict[str, Any],
+        rule: Mapping[str, Any],
         signals: List[Signal],
         context: Context,
+        max_severity: int,
     ) -> Optional[Hypothesis]:
         """Create hypothesis from matching rule."""
         hypothesis_type = HypothesisType(rule["hypothesis_type"])
 
         hypothesis = Hypothesis(
-            id=f"{hypothesis_type.value}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
+            id=self._hypothesis_id(hypothesis_type.value),
             title=rule["title"],
             description=rule["description"],
             hypothesis_type=hypothesis_type,
-            confidence=self._calculate_confidence(rule, signals),
+            confidence=self._calculate_confidence(rule, signals, max_severity),
             likelihood=rule.get("likelihood", 0.5),
             impact=rule.get("impact", "medium"),
-            supporting_signals=[s.id for s in signals],
-            attack_steps=rule.get("attack_steps", []),
-            mitigations=rule.get("mitigations", []),
+            supporting_signals=list(map(_signal_id, signals)),
+            attack_steps=list(rule.get("attack_steps", ())),
+            mitigations=list(rule.get("mitigations", ())),
             time_to_compromise=rule.get("time_to_compromise"),
             detection_difficulty=rule.get("detection_difficulty", "medium"),
         )
 
         return hypothesis
 
-    def _has_trigger_signals(self, signals: List[Signal], triggers: List[str]) -> bool:
-        """Check if context has trigger signals."""
-        signal_types = {s.signal_type for s in signals}
-        return any(trigger in signal_types for trigger in triggers)
-
-    def _identify_attack_chains(self, signals: List[Signal]) -> List[Dict[str, Any]]:
+    def _identify_attack_chains(
+        self,
+        signals: List[Signal],
+        signal_types: FrozenSet[str],
+    ) -> List[Dict[str, Any]]:
         """Identify potential attack chains from signals."""
         chains = []
 
-        # Common attack chain patterns
-        chain_patterns = [
-            {
-                "name": "Reconnaissance to Exploitation",
-                "description": "Discovery followed by vulnerability exploitation",
-                "signal_sequence": ["DNS", "SUBDOMAIN", "PORT", "VULNERABILITY"],
-                "steps": [
-                    "DNS reconnaissance",
-                    "Subdomain enumeration",
-                    "Port scanning",
-                    "Vulnerability discovery",
-                    "Exploitation",
-                ],
-                "time_to_compromise": "hours",
-            },
-            {
-                "name": "Lateral Movement",
-                "description": "Movement between compromised systems",
-                "signal_sequence": ["AUTHENTICATION", "PRIVILEGE_ESCALATION", "LATERAL"],
-                "steps": [
-                    "Initial compromise",
-                    "Credential theft",
-                    "Privilege escalation",
-                    "Lateral movement",
-                ],
-                "time_to_compromise": "days",
-            },
-        ]
-
-        for pattern in chain_patterns:
-            if self._matches_attack_chain(signals, pattern):
-                chain_signals = [s for s in signals if s.signal_type in pattern["signal_sequence"]]
-                chains.append(
-                    {
-                        **pattern,
-                        "signals": chain_signals,
-                    }
-                )
+        for index in _matching_attack_chains(signal_types):
+            pattern = _ATTACK_CHAIN_PATTERNS[index]
+            chain_signals = [s for s in signals if s.signal_type in pattern["signal_types"]]
+            chains.append(
+                {
+                    **pattern,
+                    "signals": chain_signals,
+                }
+            )
 
         return chains
 
-    def _matches_attack_chain(self, signals: List[Signal], pattern: Dict[str, Any]) -> bool:
-        """Check if signals match attack chain pattern."""
-        signal_types = {s.signal_type for s in signals}
-        required_types = set(pattern["signal_sequence"])
-
-        # Check if we have at least 3 of the required signal types
-        overlap = len(signal_types & required_types)
-        return overlap >= 3
-
-    def _calculate_confidence(self, rule: Dict[str, Any], signals: List[Signal]) -> ConfidenceLevel:
+    def _calculate_confidence(
+        self,
+        rule: Mapping[str, Any],
+        signals: List[Signal],
+        max_severity: int,
+    ) -> ConfidenceLevel:
         """Calculate confidence level for hypothesis."""
-        base_confidence = rule.get("base_confidence", 0.5)
-
-        # Boost confidence based on signal quality
-        signal_boost = min(0.3, len(signals) * 0.1)
-
-        # Boost confidence based on severity
-        severity_levels = {"critical": 5, "high": 4, "medium": 3, "low": 2, "info": 1}
-        max_severity = max(severity_levels.get(s.severity.lower(), 0) for s in signals)
-        severity_boost = max_severity * 0.1
-
-        total_confidence = base_confidence + signal_boost + severity_boost
-
-        # Convert to confidence level
-        if total_confidence >= 0.9:
-            return ConfidenceLevel.VERY_HIGH
-        elif total_confidence >= 0.7:
-            return ConfidenceLevel.HIGH
-        elif total_confidence >= 0.5:
-            return ConfidenceLevel.MEDIUM
-        elif total_confidence >= 0.3:
-            return ConfidenceLevel.LOW
-        else:
-            return ConfidenceLevel.VERY_LOW
+        # The signal boost saturates at 3 signals, so clamping keeps the cache small
+        return _rule_confidence(
+            rule.get("base_confidence", 0.5), min(len(signals), 3), max_severity
+        )
 
     def _score_to_confidence(self, score: float) -> ConfidenceLevel:
         """Convert numeric score to confidence level."""
-        if score >= 90:
-            return ConfidenceLevel.VERY_HIGH
-        elif score >= 80:
-            return ConfidenceLevel.HIGH
-        elif score >= 60:
-            return ConfidenceLevel.MEDIUM
-        elif score >= 40:
-            return ConfidenceLevel.LOW
-        else:
-            return ConfidenceLevel.VERY_LOW
+        return _CONFIDENCE_ORDER[bisect.bisect_right(_SCORE_CONFIDENCE_THRESHOLDS, score)]
 
     def _generate_attack_steps(self, hypothesis_type: HypothesisType) -> List[str]:
         """Generate attack steps for hypothesis type."""
-        step_templates = {
-            HypothesisType.SUPPLY_CHAIN: [
-                "Compromise trusted supplier",
-                "Inject malicious code/components",
-                "Distribute through legitimate channels",
-                "Exploit trust relationships",
-            ],
-            HypothesisType.INSIDER_THREAT: [
-                "Abuse legitimate access",
-                "Exfiltrate sensitive data",
-                "Cover tracks or maintain access",
-                "Escalate privileges if needed",
-            ],
-            HypothesisType.RANSOMWARE: [
-                "Initial access through phishing/vulnerability",
-                "Deploy ransomware payload",
-                "Encrypt critical files",
-                "Demand ransom payment",
-            ],
-        }
-
-        return step_templates.get(hypothesis_type, ["Attack steps not specified"])
+        return list(_STEP_TEMPLATES.get(hypothesis_type, ("Attack steps not specified",)))
 
     def _generate_mitigations(self, hypothesis_type: HypothesisType) -> List[str]:
         """Generate mitigations for hypothesis type."""
-        mitigation_templates = {
-            HypothesisType.SUPPLY_CHAIN: [
-                "Implement software composition analysis",
-                "Verify supplier security practices",
-                "Monitor third-party dependencies",
-                "Establish secure development practices",
-            ],
-            HypothesisType.INSIDER_THREAT: [
-                "Implement principle of least privilege",
-                "Monitor user behavior analytics",
-                "Conduct regular access reviews",
-                "Implement data loss prevention",
-            ],
-            HypothesisType.RANSOMWARE: [
-                "Regular offline backups",
-                "Network segmentation",
-                "Email security and awareness training",
-                "Endpoint detection and response",
-            ],
-        }
-
-        return mitigation_templates.get(hypothesis_type, ["Implement security controls"])
+        return list(_MITIGATION_TEMPLATES.get(hypothesis_type, ("Implement security controls",)))
 
     def _filter_and_sort_hypotheses(self, hypotheses: List[Hypothesis]) -> List[Hypothesis]:
         """Filter and sort hypotheses by confidence and impact."""
         # Filter by confidence threshold
-        confidence_values = {
-            ConfidenceLevel.VERY_HIGH: 1.0,
-            ConfidenceLevel.HIGH: 0.8,
-            ConfidenceLevel.MEDIUM: 0.6,
-            ConfidenceLevel.LOW: 0.4,
-            ConfidenceLevel.VERY_LOW: 0.2,
-        }
-
-        filtered = [
-            h
-            for h in hypotheses
-            if confidence_values[h.confidence] >= self.min_confidence_threshold
-        ]
-
-        # Sort by confidence and impact
-        impact_weights = {"critical": 3, "high": 2, "medium": 1, "low": 0}
-
-        def sort_key(h):
-            conf_weight = confidence_values[h.confidence]
-            impact_weight = impact_weights.get(h.impact, 0)
-            return (conf_weight, impact_weight, h.likelihood)
+        min_confidence = self.min_confidence_threshold
+        filtered = [h for h in hypotheses if h._sort_key[0] >= min_confidence]
 
-        filtered.sort(key=sort_key, reverse=True)
-
-        return filtered[: self.max_hypotheses]
+        # Top hypotheses by confidence, impact and likelihood
+        return heapq.nlargest(self.max_hypotheses, filtered, key=attrgetter("_sort_key"))
 
     def _calculate_analysis_metrics(self, analysis: HypothesisAnalysis) -> None:
         """Calculate analysis metrics."""
-        analysis.total_hypotheses = len(analysis.hypotheses)
+        hypotheses = analysis.hypotheses
+        analysis.total_hypotheses = len(hypotheses)
 
         # Count confidence levels
-        for hypothesis in analysis.hypotheses:
-            if hypothesis.confidence in {ConfidenceLevel.VERY_HIGH, ConfidenceLevel.HIGH}:
-                analysis.high_confidence += 1
-            elif hypothesis.confidence == ConfidenceLevel.MEDIUM:
-                analysis.medium_confidence += 1
-            else:
-                analysis.low_confidence += 1
-
-            # Count impact levels
-            if hypothesis.impact == "critical":
-                analysis.critical_impact += 1
-            elif hypothesis.impact == "high":
-                analysis.high_impact += 1
-
-            # Track threat landscape
-            h_type = hypothesis.hypothesis_type.value
-            analysis.threat_landscape[h_type] = analysis.threat_landscape.get(h_type, 0) + 1
+        confidence_counts = Counter(map(attrgetter("_confidence_rank"), hypotheses))
+        analysis.high_confidence = sum(
+            confidence_counts[rank] for rank in range(_HIGH_CONFIDENCE_RANK, len(_CONFIDENCE_ORDER))
+        )
+        analysis.medium_confidence = confidence_counts[_MEDIUM_CONFIDENCE_RANK]
+        analysis.low_confidence = (
+            analysis.total_hypotheses - analysis.high_confidence - analysis.medium_confidence
+        )
+
+        # Count impact levels
+        impact_counts = Counter(map(attrgetter("impact"), hypotheses))
+        analysis.critical_impact = impact_counts["critical"]
+        analysis.high_impact = impact_counts["high"]
+
+        # Track threat landscape
+        analysis.threat_landscape = dict(Counter(map(attrgetter("_type_value"), hypotheses)))
 
         # Calculate attack surface score
         if analysis.total_hypotheses > 0:
-            high_impact_ratio = (
-                analysis.critical_impact + analysis.high_impact
-            ) / analysis.total_hypotheses
-            high_conf_ratio = analysis.high_confidence / analysis.total_hypotheses
-            analysis.attack_surface_score = (high_impact_ratio * 0.6 + high_conf_ratio * 0.4) * 100
+            analysis.attack_surface_score = _attack_surface_score(
+                analysis.critical_impact + analysis.high_impact,
+                analysis.high_confidence,
+                analysis.total_hypotheses,
+            )
 
     def _generate_investigations(self, analysis: HypothesisAnalysis) -> List[str]:
         """Generate recommended investigations."""
         investigations = []
 
+        # Bucket counts come from _calculate_analysis_metrics, so no further
+        # passes over the hypotheses are needed
+
         # Priority investigations based on high-impact hypotheses
-        critical_hypotheses = [h for h in analysis.hypotheses if h.impact == "critical"]
-        if critical_hypotheses:
+        if analysis.critical_impact:
             investigations.append(
-                f"URGENT: Investigate {len(critical_hypotheses)} critical threat hypotheses"
+                f"URGENT: Investigate {analysis.critical_impact} critical threat hypotheses"
             )
 
         # High-confidence hypotheses
-        high_conf_hypotheses = [
-            h
-            for h in analysis.hypotheses
-            if h.confidence in {ConfidenceLevel.VERY_HIGH, ConfidenceLevel.HIGH}
-        ]
-        if high_conf_hypotheses:
+        if analysis.high_confidence:
             investigations.append(
-                f"HIGH: Validate {len(high_conf_hypotheses)} high-confidence threat scenarios"
+                f"HIGH: Validate {analysis.high_confidence} high-confidence threat scenarios"
             )
 
         # Most common threat types
         if analysis.threat_landscape:
-            top_threat = max(analysis.threat_landscape.items(), key=lambda x: x[1])
-            investigations.append(
-                f"Focus on {top_threat[0]} threats ({top_threat[1]} hypotheses detected)"
-            )
+            top_type, top_count = max(analysis.threat_landscape.items(), key=itemgetter(1))
+            investigations.append(f"Focus on {top_type} threats ({top_count} hypotheses detected)")
 
         return investigations[:5]  # Limit to top 5
 
-    def _initialize_hypothesis_rules(self) -> Dict[str, List[Dict[str, Any]]]:
+    def _initialize_hypothesis_rules(self) -> Mapping[str, Tuple[Mapping[str, Any], ...]]:
         """Initialize hypothesis generation rules."""
-        return {
-            "VULNERABILITY": [
-                {
-                    "hypothesis_type": "vulnerability_exploitation",
-                    "title": "Vulnerability Exploitation Attempt",
-                    "description": "Critical vulnerabilities may be actively exploited",
-                    "min_severity": "critical",
-                    "likelihood": 0.8,
-                    "impact": "critical",
-                    "attack_steps": [
-                        "Vulnerability discovery",
-                        "Exploit development/acquisition",
-                        "Exploitation attempt",
-                        "Post-exploitation activities",
-                    ],
-                    "mitigations": [
-                        "Immediate patching",
-                        "Virtual patching",
-                        "Network isolation",
-                        "Increased monitoring",
-                    ],
-                    "time_to_compromise": "hours",
-                    "detection_difficulty": "medium",
-                },
-            ],
-            "PORT": [
-                {
-                    "hypothesis_type": "lateral_movement",
-                    "title": "Lateral Movement Pathway",
-                    "description": "Open ports may facilitate lateral movement",
-                    "min_signals": 3,
-                    "likelihood": 0.6,
-                    "impact": "high",
-                    "attack_steps": [
-                        "Network reconnaissance",
-                        "Port scanning",
-                        "Service identification",
-                        "Exploitation",
-                        "Lateral movement",
-                    ],
-                    "mitigations": [
-                        "Close unnecessary ports",
-                        "Implement network segmentation",
-                        "Port knocking",
-                        "Intrusion detection",
-                    ],
-                    "time_to_compromise": "days",
-                    "detection_difficulty": "medium",
-                },
-            ],
-            "DNS": [
-                {
-                    "hypothesis_type": "data_exfiltration",
-                    "title": "DNS-based Data Exfiltration",
-                    "description": "DNS queries may be used for data exfiltration",
-                    "pattern": "exfil",
-                    "likelihood": 0.5,
-                    "impact": "high",
-                    "attack_steps": [
-                        "Establish C2 via DNS",
-                        "Encode data in DNS queries",
-                        "Exfiltrate data slowly",
-                        "Avoid detection",
-                    ],
-                    "mitigations": [
-                        "DNS monitoring",
-                        "Query analysis",
-                        "DNS filtering",
-                        "Traffic analysis",
-                    ],
-                    "time_to_compromise": "weeks",
-                    "detection_difficulty": "hard",
-                },
-            ],
-        }
+        return _HYPOTHESIS_RULES
 
-    def _initialize_attack_patterns(self) -> Dict[str, List[str]]:
+    def _initialize_attack_patterns(self) -> Mapping[str, Tuple[str, ...]]:
         """Initialize attack patterns and TTPs."""
-        return {
-            "reconnaissance": ["dns_query", "port_scan", "service_enum"],
-            "initial_access": ["phishing", "exploit", "valid_accounts"],
-            "execution": ["command_line", "scripts", "signed_binary"],
-            "persistence": ["scheduled_tasks", "services", "registry"],
-            "privilege_escalation": ["process_injection", "access_token_manipulation"],
-            "defense_evasion": ["obfuscation", "rootkit", "code_signing"],
-            "credential_access": ["brute_force", "credential_dumping"],
-            "discovery": ["system_info", "network_shares", "process_discovery"],
-            "lateral_movement": ["remote_services", "remote_execution", "smb"],
-            "collection": ["data_from_local_system", "data_staged"],
-            "exfiltration": ["exfiltration_over_c2", "exfiltration_over_web"],
-            "impact": ["data_encryption", "service_stop", "data_destruction"],
-        }
+        return _ATTACK_PATTERNS
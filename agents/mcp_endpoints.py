@@ -3,23 +3,26 @@ MCP Integration Endpoints - Expose agents via MCP protocol.
 """
 
 import asyncio
+import copy
 import json
-from typing import Any, Dict, List, Optional, Union
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 
 from core.models.context import Context
 from core.models.entity import Entity
 from core.models.signal import Signal
 from core.scoring.risk import ScoringResult
 
-from agents.context_summarizer import ContextSummarizer
-from agents.gap_detector import GapDetector
-from agents.hypothesis_generator import HypothesisGenerator
-from agents.explainability import ExplainabilityAgent
+from agents.base_agent_async import AgentResult
 from agents.mcp_orchestrator import get_orchestrator, MCPOrchestrator
 
+logger = logging.getLogger(__name__)
+
 
 class MCPMessageType(Enum):
     """MCP message types."""
@@ -42,7 +45,11 @@ class MCPMethod(Enum):
     GET_AUDIT_LOGS = "get_audit_logs"
 
 
-@dataclass
+# Method lookup by wire name
+_METHOD_BY_VALUE = {method.value: method for method in MCPMethod}
+
+
+@dataclass(slots=True)
 class MCPMessage:
     """MCP protocol message."""
 
@@ -73,7 +80,10 @@ class MCPMessage:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MCPMessage":
         """Create from dictionary."""
-        method = MCPMethod(data["method"])
+        method = _METHOD_BY_VALUE.get(data["method"])
+        if method is None:
+            raise ValueError(f"{data['method']!r} is not a valid MCPMethod")
+
         return cls(
             id=data.get("id"),
             method=method,
@@ -86,16 +96,62 @@ class MCPMessage:
         )
 
 
+# Parsed (entity fields, signal fields) of a context payload; tuples so cache
+# entries cannot be mutated through the contexts built from them
+_ContextFields = Tuple[Optional[Tuple[Any, ...]], Tuple[Tuple[Any, ...], ...]]
+
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO timestamp, memoized since clients often repeat timestamps."""
+    return datetime.fromisoformat(value)
+
+
+def _serialize_result(result: AgentResult) -> Dict[str, Any]:
+    """Convert an agent result to its MCP response form."""
+    return {
+        "success": result.success,
+        "output": result.output,
+        "error": result.error,
+        "duration_ms": result.duration_ms,
+        "timestamp": result.timestamp.isoformat(),
+    }
+
+
 class MCPEndpointHandler:
     """Handle MCP endpoint requests."""
 
-    def __init__(self):
-        """Initialize MCP endpoint handler."""
+    def __init__(self, context_cache_size: int = 512):
+        """Initialize MCP endpoint handler.
+
+        Args:
+            context_cache_size: Maximum number of parsed payloads kept for
+                repeated identical payloads (0 disables caching)
+        """
         self.orchestrator = get_orchestrator()
+        self.context_cache_size = context_cache_size
+        self._context_cache: "OrderedDict[str, _ContextFields]" = OrderedDict()
         self._initialize_agents()
 
+        # Method dispatch table
+        self._handlers = {
+            MCPMethod.ANALYZE: self._handle_analyze,
+            MCPMethod.EXECUTE_PIPELINE: self._handle_execute_pipeline,
+            MCPMethod.LIST_AGENTS: self._handle_list_agents,
+            MCPMethod.GET_AGENT_INFO: self._handle_get_agent_info,
+            MCPMethod.CREATE_PIPELINE: self._handle_create_pipeline,
+            MCPMethod.LIST_PIPELINES: self._handle_list_pipelines,
+            MCPMethod.GET_AUDIT_LOGS: self._handle_get_audit_logs,
+        }
+
     def _initialize_agents(self) -> None:
         """Initialize and register all agents."""
+        # Agent modules are imported here so importing this module stays light
+        from agents.context_summarizer import ContextSummarizer
+        from agents.gap_detector import GapDetector
+        from agents.hypothesis_generator import HypothesisGenerator
+        from agents.explainability import ExplainabilityAgent
+
         # Create agent instances
         self.agents = {
             "context_summarizer": ContextSummarizer(
@@ -134,23 +190,12 @@ class MCPEndpointHandler:
     async def handle_request(self, message: MCPMessage) -> MCPMessage:
         """Handle MCP request."""
         try:
-            if message.method == MCPMethod.ANALYZE:
-                result = await self._handle_analyze(message.params)
-            elif message.method == MCPMethod.EXECUTE_PIPELINE:
-                result = await self._handle_execute_pipeline(message.params)
-            elif message.method == MCPMethod.LIST_AGENTS:
-                result = await self._handle_list_agents(message.params)
-            elif message.method == MCPMethod.GET_AGENT_INFO:
-                result = await self._handle_get_agent_info(message.params)
-            elif message.method == MCPMethod.CREATE_PIPELINE:
-                result = await self._handle_create_pipeline(message.params)
-            elif message.method == MCPMethod.LIST_PIPELINES:
-                result = await self._handle_list_pipelines(message.params)
-            elif message.method == MCPMethod.GET_AUDIT_LOGS:
-                result = await self._handle_get_audit_logs(message.params)
-            else:
+            handler = self._handlers.get(message.method)
+            if handler is None:
                 raise ValueError(f"Unknown method: {message.method}")
 
+            result = await handler(message.params)
+
             return MCPMessage(
                 id=message.id,
                 method=message.method,
@@ -195,13 +240,7 @@ class MCPEndpointHandler:
             agent_name, context, scoring_result, user=user
         )
 
-        return {
-            "success": result.success,
-            "output": result.output,
-            "error": result.error,
-            "duration_ms": result.duration_ms,
-            "timestamp": result.timestamp.isoformat(),
-        }
+        return _serialize_result(result)
 
     async def _handle_execute_pipeline(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle execute_pipeline request."""
@@ -231,22 +270,18 @@ class MCPEndpointHandler:
             pipeline_name, context, scoring_result, user=user, timeout=timeout
         )
 
-        # Convert results to serializable format
+        # Convert results to serializable format, counting successes on the way
         serializable_results = {}
+        successful_agents = 0
         for agent_name, result in results.items():
-            serializable_results[agent_name] = {
-                "success": result.success,
-                "output": result.output,
-                "error": result.error,
-                "duration_ms": result.duration_ms,
-                "timestamp": result.timestamp.isoformat(),
-            }
+            serializable_results[agent_name] = _serialize_result(result)
+            successful_agents += bool(result.success)
 
         return {
             "pipeline_name": pipeline_name,
             "results": serializable_results,
             "total_agents": len(results),
-            "successful_agents": sum(1 for r in results.values() if r.success),
+            "successful_agents": successful_agents,
         }
 
     async def _handle_list_agents(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -303,16 +338,23 @@ class MCPEndpointHandler:
         """Handle list_pipelines request."""
         pipelines = self.orchestrator.list_pipelines()
 
-        pipeline_info = {}
-        for pipeline_name in pipelines:
-            pipeline = self.orchestrator.pipelines[pipeline_name]
-            pipeline_info[pipeline_name] = {
+        # Callers that only need names can skip the per-pipeline details
+        if not params.get("verbose", True):
+            return {
+                "pipelines": pipelines,
+                "total_pipelines": len(pipelines),
+            }
+
+        pipeline_info = {
+            pipeline_name: {
                 "parallel": pipeline.parallel,
                 "agents": [agent.name for agent in pipeline.agents],
                 "total_agents": len(pipeline.agents),
                 "duration_ms": pipeline.duration_ms,
                 "has_results": len(pipeline.results) > 0,
             }
+            for pipeline_name, pipeline in self.orchestrator.pipelines_view().items()
+        }
 
         return {
             "pipelines": pipelines,
@@ -342,35 +384,99 @@ class MCPEndpointHandler:
         }
 
     def _parse_context(self, context_data: Dict[str, Any]) -> Context:
-        """Parse context from dictionary."""
+        """Parse context from dictionary, reusing parsed fields for identical payloads.
+
+        Only the immutable parsed fields are cached; every call returns a fresh
+        Context, so agents may mutate it without affecting later requests.
+        """
+        if self.context_cache_size <= 0:
+            return self._build_context(self._parse_context_fields(context_data))
+
+        try:
+            cache_key = json.dumps(context_data, sort_keys=True)
+        except (TypeError, ValueError):
+            # Not JSON-shaped, so it cannot be keyed reliably
+            return self._build_context(self._parse_context_fields(context_data))
+
+        fields = self._context_cache.get(cache_key)
+        if fields is None:
+            fields = self._parse_context_fields(context_data)
+            self._context_cache[cache_key] = fields
+            if len(self._context_cache) > self.context_cache_size:
+                self._context_cache.popitem(last=False)
+        else:
+            self._context_cache.move_to_end(cache_key)
+
+        return self._build_context(fields)
+
+    def _parse_context_fields(self, context_data: Dict[str, Any]) -> _ContextFields:
+        """Extract entity and signal constructor fields from dictionary."""
         # Parse entity
         entity_data = context_data.get("entity")
-        entity = None
+        entity_fields = None
         if entity_data:
-            entity = Entity(
-                id=entity_data["id"],
-                entity_type=entity_data["entity_type"],
-                name=entity_data["name"],
-                description=entity_data.get("description"),
-                properties=entity_data.get("properties"),
+            entity_fields = (
+                entity_data["id"],
+                entity_data["entity_type"],
+                entity_data["name"],
+                entity_data.get("description"),
+                entity_data.get("properties"),
             )
 
         # Parse signals
-        signals_data = context_data.get("signals", [])
-        signals = []
-        for signal_data in signals_data:
-            signal = Signal(
-                id=signal_data["id"],
-                source=signal_data["source"],
-                signal_type=signal_data["signal_type"],
-                severity=signal_data["severity"],
-                description=signal_data.get("description"),
-                timestamp=datetime.fromisoformat(signal_data["timestamp"])
+        signal_fields = tuple(
+            (
+                signal_data["id"],
+                signal_data["source"],
+                signal_data["signal_type"],
+                signal_data["severity"],
+                signal_data.get("description"),
+                _parse_timestamp(signal_data["timestamp"])
                 if signal_data.get("timestamp")
                 else None,
-                entity_id=signal_data.get("entity_id"),
+                signal_data.get("entity_id"),
             )
-            signals.append(signal)
+            for signal_data in context_data.get("signals", [])
+        )
+
+        return entity_fields, signal_fields
+
+    def _build_context(self, fields: _ContextFields) -> Context:
+        """Build fresh context objects from parsed fields."""
+        entity_fields, signal_fields = fields
+
+        entity = None
+        if entity_fields:
+            entity_id, entity_type, name, description, properties = entity_fields
+            entity = Entity(
+                id=entity_id,
+                entity_type=entity_type,
+                name=name,
+                description=description,
+                # Cached alongside the fields, so each context gets its own copy
+                properties=copy.deepcopy(properties),
+            )
+
+        signals = [
+            Signal(
+                id=signal_id,
+                source=source,
+                signal_type=signal_type,
+                severity=severity,
+                description=description,
+                timestamp=timestamp,
+                entity_id=entity_id,
+            )
+            for (
+                signal_id,
+                source,
+                signal_type,
+                severity,
+                description,
+                timestamp,
+                entity_id,
+            ) in signal_fields
+        ]
 
         return Context(entity=entity, signals=signals)
 
@@ -385,6 +491,18 @@ class MCPEndpointHandler:
         )
 
 
+# Endpoint descriptions for the startup log
+_ENDPOINT_SUMMARIES = (
+    ("analyze", "Execute single agent"),
+    ("execute_pipeline", "Execute agent pipeline"),
+    ("list_agents", "List available agents"),
+    ("get_agent_info", "Get agent information"),
+    ("create_pipeline", "Create execution pipeline"),
+    ("list_pipelines", "List available pipelines"),
+    ("get_audit_logs", "Get audit logs"),
+)
+
+
 class MCPServer:
     """MCP Server for agent integration."""
 
@@ -398,24 +516,21 @@ class MCPServer:
     async def start(self) -> None:
         """Start MCP server."""
         self.running = True
-        print(f"MCP Server starting on {self.host}:{self.port}")
+        logger.info("MCP Server starting on %s:%s", self.host, self.port)
 
         # In a real implementation, this would start an actual HTTP/WebSocket server
         # For now, we'll simulate the server startup
-        print("MCP Server started successfully")
-        print("Available endpoints:")
-        print("  - analyze: Execute single agent")
-        print("  - execute_pipeline: Execute agent pipeline")
-        print("  - list_agents: List available agents")
-        print("  - get_agent_info: Get agent information")
-        print("  - create_pipeline: Create execution pipeline")
-        print("  - list_pipelines: List available pipelines")
-        print("  - get_audit_logs: Get audit logs")
+        logger.info("MCP Server started successfully")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Available endpoints:\n%s",
+                "\n".join(f"  - {name}: {summary}" for name, summary in _ENDPOINT_SUMMARIES),
+            )
 
     async def stop(self) -> None:
         """Stop MCP server."""
         self.running = False
-        print("MCP Server stopped")
+        logger.info("MCP Server stopped")
 
     async def handle_message(self, message_data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle incoming MCP message."""
@@ -439,6 +554,8 @@ class MCPServer:
 # Utility functions for MCP integration
 def create_sample_context() -> Dict[str, Any]:
     """Create sample context for testing."""
+    now = datetime.utcnow().isoformat()
+
     return {
         "entity": {
             "id": "sample-entity-001",
@@ -457,7 +574,7 @@ def create_sample_context() -> Dict[str, Any]:
                 "signal_type": "VULNERABILITY",
                 "severity": "critical",
                 "description": "Critical vulnerability detected",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now,
                 "entity_id": "sample-entity-001",
             },
             {
@@ -466,7 +583,7 @@ def create_sample_context() -> Dict[str, Any]:
                 "signal_type": "PORT",
                 "severity": "high",
                 "description": "Open port detected",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now,
                 "entity_id": "sample-entity-001",
             },
         ],
@@ -552,5 +669,27 @@ async def example_mcp_usage():
 
 
 if __name__ == "__main__":
+    import queue
+    from logging.handlers import QueueHandler, QueueListener
+
+    # Write log records from a listener thread so handler I/O stays off the event loop
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    log_listener = QueueListener(log_queue, logging.StreamHandler())
+    logging.basicConfig(
+        level=logging.INFO, format="%(message)s", handlers=[QueueHandler(log_queue)]
+    )
+    log_listener.start()
+
+    # Prefer the libuv-based event loop when it is installed
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     # Run example usage
-    asyncio.run(example_mcp_usage())
+    try:
+        asyncio.run(example_mcp_usage())
+    finally:
+        log_listener.stop()
@@ -3,9 +3,12 @@ MCP Orchestrator - Coordinate multi-agent execution.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional, Callable
+from array import array
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime
+from functools import partial
+from time import perf_counter
+from types import MappingProxyType
 
 from core.models.context import Context
 from core.scoring.risk import ScoringResult
@@ -13,7 +16,7 @@ from agents.base_agent_async import BaseAgentAsync, AgentResult
 from agents.audit_system.audit_logger import get_audit_logger, AuditLevel
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPPipeline:
     """Pipeline for coordinated agent execution."""
 
@@ -37,6 +40,20 @@ class MCPPipeline:
             "duration_ms": self.duration_ms,
         }
 
+    def summary(self) -> Dict[str, Any]:
+        """Get agent names, success flags and durations of the current results.
+
+        Lighter than to_dict for metric scraping: the flags and durations are
+        returned as parallel arrays and agent outputs are not serialized.
+        """
+        results = self.results.values()
+        return {
+            "pipeline": self.name,
+            "agents": list(self.results),
+            "success": array("b", [r.success for r in results]),
+            "duration_ms": array("d", [r.duration_ms for r in results]),
+        }
+
 
 class MCPOrchestrator:
     """Orchestrate multi-agent execution via MCP."""
@@ -44,17 +61,26 @@ class MCPOrchestrator:
     def __init__(self):
         """Initialize orchestrator."""
         self.audit_logger = get_audit_logger()
+        self._audit_info = partial(
+            self.audit_logger.log_event, agent_name="MCPOrchestrator", level=AuditLevel.INFO
+        )
+        self._audit_error = partial(
+            self.audit_logger.log_event, agent_name="MCPOrchestrator", level=AuditLevel.ERROR
+        )
         self.agents: Dict[str, BaseAgentAsync] = {}
         self.pipelines: Dict[str, MCPPipeline] = {}
+        self._agent_names: FrozenSet[str] = frozenset()
 
     def register_agent(self, agent: BaseAgentAsync) -> None:
         """Register agent."""
+        # Re-registering the same agent is a no-op; a different agent replaces it
+        if self.agents.get(agent.name) is agent:
+            return
         self.agents[agent.name] = agent
-        self.audit_logger.log_event(
-            agent_name="MCPOrchestrator",
+        self._agent_names = self._agent_names | {agent.name}
+        self._audit_info(
             action="register_agent",
             status="completed",
-            level=AuditLevel.INFO,
             details={"agent": agent.name, "version": agent.version},
         )
 
@@ -88,36 +114,36 @@ class MCPOrchestrator:
         if not pipeline:
             raise ValueError(f"Pipeline {pipeline_name} not found")
 
-        self.audit_logger.log_event(
-            agent_name="MCPOrchestrator",
+        self._audit_info(
             action="execute_pipeline",
             status="started",
-            level=AuditLevel.INFO,
             details={"pipeline": pipeline_name, "agents": len(pipeline.agents)},
             user=user,
         )
 
         try:
             if pipeline.parallel:
-                results = await self._execute_parallel(
+                results, success_count = await self._execute_parallel(
+                    pipeline, context, scoring_result, user, timeout
+                )
+            elif len(pipeline.agents) == 1:
+                results, success_count = await self._execute_single(
                     pipeline, context, scoring_result, user, timeout
                 )
             else:
-                results = await self._execute_sequential(
+                results, success_count = await self._execute_sequential(
                     pipeline, context, scoring_result, user, timeout
                 )
 
             pipeline.results = results
 
-            self.audit_logger.log_event(
-                agent_name="MCPOrchestrator",
+            self._audit_info(
                 action="execute_pipeline",
                 status="completed",
-                level=AuditLevel.INFO,
                 duration_ms=pipeline.duration_ms,
                 details={
                     "pipeline": pipeline_name,
-                    "success_count": sum(1 for r in results.values() if r.success),
+                    "success_count": success_count,
                     "total_count": len(results),
                 },
                 user=user,
@@ -126,43 +152,76 @@ class MCPOrchestrator:
             return results
 
         except Exception as e:
-            self.audit_logger.log_event(
-                agent_name="MCPOrchestrator",
+            self._audit_error(
                 action="execute_pipeline",
                 status="failed",
-                level=AuditLevel.ERROR,
                 error=str(e),
                 details={"pipeline": pipeline_name},
                 user=user,
             )
             raise
 
-    async def _execute_sequential(
+    async def _execute_single(
         self,
         pipeline: MCPPipeline,
         context: Context,
         scoring_result: Optional[ScoringResult],
         user: Optional[str],
         timeout: float,
-    ) -> Dict[str, AgentResult]:
-        """Execute agents sequentially."""
-        import time
+    ) -> Tuple[Dict[str, AgentResult], int]:
+        """Execute a single-agent sequential pipeline directly, without scheduling a task.
+
+        Runs in the caller's task, so agent errors and the caller's own
+        cancellation propagate exactly as in a sequential pipeline.
+        """
+        start_time = perf_counter()
+        agent = pipeline.agents[0]
 
-        start_time = time.time()
+        result = await agent.run(
+            context=context,
+            scoring_result=scoring_result,
+            user=user,
+            timeout=timeout,
+        )
+
+        pipeline.duration_ms = (perf_counter() - start_time) * 1000
+        return {agent.name: result}, int(result.success)
+
+    async def _execute_sequential(
+        self,
+        pipeline: MCPPipeline,
+        context: Context,
+        scoring_result: Optional[ScoringResult],
+        user: Optional[str],
+        timeout: float,
+    ) -> Tuple[Dict[str, AgentResult], int]:
+        """Execute agents sequentially, returning results and the success count."""
+        start_time = perf_counter()
         results = {}
-        per_agent_timeout = timeout / len(pipeline.agents)
+        success_count = 0
+        # Agents share one deadline so time left by fast agents carries over
+        deadline = start_time + timeout
 
         for agent in pipeline.agents:
-            result = await agent.run(
-                context=context,
-                scoring_result=scoring_result,
-                user=user,
-                timeout=per_agent_timeout,
-            )
+            remaining = deadline - perf_counter()
+            if remaining <= 0:
+                result = AgentResult(
+                    agent_name=agent.name,
+                    success=False,
+                    error="Pipeline deadline exceeded",
+                )
+            else:
+                result = await agent.run(
+                    context=context,
+                    scoring_result=scoring_result,
+                    user=user,
+                    timeout=remaining,
+                )
             results[agent.name] = result
+            success_count += result.success
 
-        pipeline.duration_ms = (time.time() - start_time) * 1000
-        return results
+        pipeline.duration_ms = (perf_counter() - start_time) * 1000
+        return results, success_count
 
     async def _execute_parallel(
         self,
@@ -171,37 +230,68 @@ class MCPOrchestrator:
         scoring_result: Optional[ScoringResult],
         user: Optional[str],
         timeout: float,
-    ) -> Dict[str, AgentResult]:
-        """Execute agents in parallel."""
-        import time
-
-        start_time = time.time()
-
-        tasks = [
-            agent.run(
-                context=context,
-                scoring_result=scoring_result,
-                user=user,
-                timeout=timeout,
+    ) -> Tuple[Dict[str, AgentResult], int]:
+        """Execute agents in parallel, returning results and the success count."""
+        start_time = perf_counter()
+
+        loop = asyncio.get_running_loop()
+        all_done = loop.create_future()
+        outcomes: List[Optional[AgentResult]] = [None] * len(pipeline.agents)
+        remaining = len(pipeline.agents)
+
+        # Record each agent's outcome from its done callback as soon as it finishes
+        def on_done(index: int, agent: BaseAgentAsync, task: asyncio.Future) -> None:
+            nonlocal remaining
+            outcomes[index] = self._task_outcome(task, agent)
+            remaining -= 1
+            if not remaining and not all_done.done():
+                all_done.set_result(None)
+
+        # Agent arguments are plain locals; hoist the remaining lookups out of the loop
+        create_task = loop.create_task
+        tasks: List[asyncio.Task] = []
+        add_task = tasks.append
+        for index, agent in enumerate(pipeline.agents):
+            task = create_task(
+                agent.run(
+                    context=context,
+                    scoring_result=scoring_result,
+                    user=user,
+                    timeout=timeout,
+                )
             )
-            for agent in pipeline.agents
-        ]
-
-        agent_results = await asyncio.gather(*tasks, return_exceptions=True)
+            task.add_done_callback(partial(on_done, index, agent))
+            add_task(task)
 
+        try:
+            if tasks:
+                await all_done
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        # Report results in pipeline order
         results = {}
-        for agent, result in zip(pipeline.agents, agent_results):
-            if isinstance(result, Exception):
-                results[agent.name] = AgentResult(
-                    agent_name=agent.name,
-                    success=False,
-                    error=str(result),
-                )
-            else:
-                results[agent.name] = result
+        success_count = 0
+        for agent, outcome in zip(pipeline.agents, outcomes):
+            results[agent.name] = outcome
+            success_count += outcome.success
+
+        pipeline.duration_ms = (perf_counter() - start_time) * 1000
+        return results, success_count
 
-        pipeline.duration_ms = (time.time() - start_time) * 1000
-        return results
+    @staticmethod
+    def _task_outcome(task: asyncio.Future, agent: BaseAgentAsync) -> AgentResult:
+        """Get a finished agent task's result, wrapping errors and cancellation as failures."""
+        try:
+            return task.result()
+        except (Exception, asyncio.CancelledError) as e:
+            return AgentResult(
+                agent_name=agent.name,
+                success=False,
+                error=str(e),
+            )
 
     async def execute_agent(
         self,
@@ -239,6 +329,20 @@ class MCPOrchestrator:
             "state": agent.get_state(),
         }
 
+    def __contains__(self, agent_name: object) -> bool:
+        """Check whether an agent is registered under the given name."""
+        return agent_name in self.agents
+
+    @property
+    def agent_names(self) -> FrozenSet[str]:
+        """Snapshot of agent names, updated by register_agent.
+
+        Only covers agents added through register_agent; direct writes to
+        ``agents`` are not reflected. Use ``in`` on the orchestrator for a
+        live membership check.
+        """
+        return self._agent_names
+
     def list_agents(self) -> List[str]:
         """List all registered agents."""
         return list(self.agents.keys())
@@ -247,6 +351,14 @@ class MCPOrchestrator:
         """List all pipelines."""
         return list(self.pipelines.keys())
 
+    def agents_view(self) -> Mapping[str, BaseAgentAsync]:
+        """Read-only live view of registered agents, without copying."""
+        return MappingProxyType(self.agents)
+
+    def pipelines_view(self) -> Mapping[str, MCPPipeline]:
+        """Read-only live view of pipelines, without copying."""
+        return MappingProxyType(self.pipelines)
+
 
 # Global orchestrator instance
 _orchestrator = MCPOrchestrator()
@@ -0,0 +1,15 @@
+"""
+Shared fixtures for agent tests.
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Create one event loop for all async agent tests."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
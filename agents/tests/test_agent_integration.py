@@ -2,8 +2,10 @@
 Integration tests for all agents working together.
 """
 
+import asyncio
 import pytest
 from datetime import datetime, timedelta
+from operator import attrgetter
 
 from core.models.entity import Entity
 from core.models.signal import Signal
@@ -14,10 +16,34 @@ from agents.context_summarizer import ContextSummarizer
 from agents.gap_detector import GapDetector
 from agents.hypothesis_generator import HypothesisGenerator
 from agents.explainability import ExplainabilityAgent
+from agents.base_agent_async import AgentResult, BaseAgentAsync
 from agents.mcp_orchestrator import MCPOrchestrator, MCPPipeline
 
+# Keep these tests on one xdist worker so they share the session-scoped fixtures
+pytestmark = pytest.mark.xdist_group("agent_integration")
 
-@pytest.fixture
+# Attributes every agent must expose
+_AGENT_INTERFACE = attrgetter("name", "version", "analyze")
+
+# Logical order for the comprehensive analysis pipeline
+_ANALYSIS_ORDER = (
+    "context_summarizer",  # First: understand the context
+    "gap_detector",  # Second: identify gaps
+    "hypothesis_generator",  # Third: generate hypotheses
+    "explainability_agent",  # Fourth: explain results
+)
+
+
+class SlowAgent(BaseAgentAsync):
+    """Agent whose analysis outlasts any short timeout."""
+
+    async def analyze(self, context, scoring_result=None):
+        """Sleep past the timeout before returning."""
+        await asyncio.sleep(1.0)
+        return AgentResult(agent_name=self.name, success=True)
+
+
+@pytest.fixture(scope="session")
 def all_agents():
     """Create all agent instances."""
     return {
@@ -51,13 +77,16 @@ def all_agents():
     }
 
 
-@pytest.fixture
-def orchestrator():
-    """Create MCP orchestrator."""
-    return MCPOrchestrator()
+@pytest.fixture(scope="session")
+def orchestrator(all_agents):
+    """Create session-wide MCP orchestrator with all agents registered."""
+    orchestrator = MCPOrchestrator()
+    for agent in all_agents.values():
+        orchestrator.register_agent(agent)
+    return orchestrator
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def production_entity():
     """Create production entity for integration testing."""
     return Entity(
@@ -76,112 +105,113 @@ def production_entity():
     )
 
 
-@pytest.fixture
+# Comprehensive signals as
+# (id, source, signal_type, severity, description, age in hours, entity_id)
+_COMPREHENSIVE_SIGNALS = (
+    # Critical vulnerabilities
+    (
+        "vuln-001",
+        "nessus",
+        "VULNERABILITY",
+        "critical",
+        "CVE-2023-1234: Remote code execution in React framework",
+        2,
+        "prod-app-01",
+    ),
+    (
+        "vuln-002",
+        "qualys",
+        "VULNERABILITY",
+        "high",
+        "CVE-2023-5678: SQL injection vulnerability",
+        6,
+        "prod-app-01",
+    ),
+    # Exposure signals
+    ("port-001", "nmap", "PORT", "high", "Port 443/tcp open - HTTPS", 12, "prod-app-01"),
+    ("port-002", "nmap", "PORT", "medium", "Port 80/tcp open - HTTP", 12, "prod-app-01"),
+    # Service signals
+    (
+        "service-001",
+        "asset_inventory",
+        "SERVICE",
+        "medium",
+        "Apache HTTP Server 2.4.41",
+        24,
+        "prod-app-01",
+    ),
+    # Configuration signals
+    (
+        "config-001",
+        "config_scanner",
+        "CONFIGURATION",
+        "medium",
+        "Weak SSL configuration detected",
+        18,
+        "prod-app-01",
+    ),
+    # Activity signals
+    (
+        "activity-001",
+        "siem",
+        "ACTIVITY",
+        "high",
+        "Suspicious login patterns detected",
+        1,
+        "prod-app-01",
+    ),
+    # DNS signals
+    ("dns-001", "dns_monitor", "DNS", "medium", "DNS query to suspicious domain", 8, "prod-app-01"),
+    # Dependency signals
+    (
+        "dep-001",
+        "dependency_scanner",
+        "DEPENDENCY",
+        "high",
+        "Vulnerable third-party dependency detected",
+        16,
+        "prod-app-01",
+    ),
+    # Authentication signals
+    (
+        "auth-001",
+        "auth_log",
+        "AUTHENTICATION",
+        "high",
+        "Multiple failed login attempts",
+        3,
+        "prod-app-01",
+    ),
+)
+
+
+@pytest.fixture(scope="session")
 def comprehensive_signals():
     """Create comprehensive signal set for integration testing."""
+    now = datetime.utcnow()
     return [
-        # Critical vulnerabilities
-        Signal(
-            id="vuln-001",
-            source="nessus",
-            signal_type="VULNERABILITY",
-            severity="critical",
-            description="CVE-2023-1234: Remote code execution in React framework",
-            timestamp=datetime.utcnow() - timedelta(hours=2),
-            entity_id="prod-app-01",
-        ),
-        Signal(
-            id="vuln-002",
-            source="qualys",
-            signal_type="VULNERABILITY",
-            severity="high",
-            description="CVE-2023-5678: SQL injection vulnerability",
-            timestamp=datetime.utcnow() - timedelta(hours=6),
-            entity_id="prod-app-01",
-        ),
-        # Exposure signals
         Signal(
-            id="port-001",
-            source="nmap",
-            signal_type="PORT",
-            severity="high",
-            description="Port 443/tcp open - HTTPS",
-            timestamp=datetime.utcnow() - timedelta(hours=12),
-            entity_id="prod-app-01",
-        ),
-        Signal(
-            id="port-002",
-            source="nmap",
-            signal_type="PORT",
-            severity="medium",
-            description="Port 80/tcp open - HTTP",
-            timestamp=datetime.utcnow() - timedelta(hours=12),
-            entity_id="prod-app-01",
-        ),
-        # Service signals
-        Signal(
-            id="service-001",
-            source="asset_inventory",
-            signal_type="SERVICE",
-            severity="medium",
-            description="Apache HTTP Server 2.4.41",
-            timestamp=datetime.utcnow() - timedelta(hours=24),
-            entity_id="prod-app-01",
-        ),
-        # Configuration signals
-        Signal(
-            id="config-001",
-            source="config_scanner",
-            signal_type="CONFIGURATION",
-            severity="medium",
-            description="Weak SSL configuration detected",
-            timestamp=datetime.utcnow() - timedelta(hours=18),
-            entity_id="prod-app-01",
-        ),
-        # Activity signals
-        Signal(
-            id="activity-001",
-            source="siem",
-            signal_type="ACTIVITY",
-            severity="high",
-            description="Suspicious login patterns detected",
-            timestamp=datetime.utcnow() - timedelta(hours=1),
-            entity_id="prod-app-01",
-        ),
-        # DNS signals
-        Signal(
-            id="dns-001",
-            source="dns_monitor",
-            signal_type="DNS",
-            severity="medium",
-            description="DNS query to suspicious domain",
-            timestamp=datetime.utcnow() - timedelta(hours=8),
-            entity_id="prod-app-01",
-        ),
-        # Dependency signals
-        Signal(
-            id="dep-001",
-            source="dependency_scanner",
-            signal_type="DEPENDENCY",
-            severity="high",
-            description="Vulnerable third-party dependency detected",
-            timestamp=datetime.utcnow() - timedelta(hours=16),
-            entity_id="prod-app-01",
-        ),
-        # Authentication signals
-        Signal(
-            id="auth-001",
-            source="auth_log",
-            signal_type="AUTHENTICATION",
-            severity="high",
-            description="Multiple failed login attempts",
-            timestamp=datetime.utcnow() - timedelta(hours=3),
-            entity_id="prod-app-01",
-        ),
+            id=signal_id,
+            source=source,
+            signal_type=signal_type,
+            severity=severity,
+            description=description,
+            timestamp=now - timedelta(hours=hours),
+            entity_id=entity_id,
+        )
+        for (
+            signal_id,
+            source,
+            signal_type,
+            severity,
+            description,
+            hours,
+            entity_id,
+        ) in _COMPREHENSIVE_SIGNALS
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def comprehensive_context(production_entity, comprehensive_signals):
     """Create comprehensive context."""
     return Context(
@@ -190,7 +220,7 @@ def comprehensive_context(production_entity, comprehensive_signals):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def comprehensive_scoring_result():
     """Create comprehensive scoring result."""
     return ScoringResult(
@@ -215,6 +245,15 @@ def comprehensive_scoring_result():
     )
 
 
+@pytest.fixture(scope="session")
+def all_agent_results(all_agents, comprehensive_context, comprehensive_scoring_result):
+    """Analyze the comprehensive context once with every agent."""
+    return {
+        agent_name: agent.analyze(comprehensive_context, comprehensive_scoring_result)
+        for agent_name, agent in all_agents.items()
+    }
+
+
 class TestAgentIntegration:
     """Test integration between all agents."""
 
@@ -222,31 +261,18 @@ class TestAgentIntegration:
         """Test all agents initialize correctly."""
         for agent_name, agent in all_agents.items():
             assert agent is not None
-            assert hasattr(agent, "name")
-            assert hasattr(agent, "version")
-            assert hasattr(agent, "analyze")
+            # Raises AttributeError if any part of the agent interface is missing
+            _AGENT_INTERFACE(agent)
 
-    def test_individual_agent_analysis(
-        self, all_agents, comprehensive_context, comprehensive_scoring_result
-    ):
+    def test_individual_agent_analysis(self, all_agent_results):
         """Test each agent can analyze individually."""
-        results = {}
-
-        for agent_name, agent in all_agents.items():
-            result = agent.analyze(comprehensive_context, comprehensive_scoring_result)
-            results[agent_name] = result
-
+        for agent_name, result in all_agent_results.items():
             assert result.success is True
             assert "output" in result.output
 
-        return results
-
-    def test_context_summarizer_integration(
-        self, all_agents, comprehensive_context, comprehensive_scoring_result
-    ):
+    def test_context_summarizer_integration(self, all_agent_results):
         """Test context summarizer integration."""
-        summarizer = all_agents["context_summarizer"]
-        result = summarizer.analyze(comprehensive_context, comprehensive_scoring_result)
+        result = all_agent_results["context_summarizer"]
 
         assert result.success is True
         summary = result.output["summary"]
@@ -264,12 +290,9 @@ class TestAgentIntegration:
         assert "exposure_highlights" in summary_data
         assert "recommendations" in summary_data
 
-    def test_gap_detector_integration(
-        self, all_agents, comprehensive_context, comprehensive_scoring_result
-    ):
+    def test_gap_detector_integration(self, all_agent_results):
         """Test gap detector integration."""
-        gap_detector = all_agents["gap_detector"]
-        result = gap_detector.analyze(comprehensive_context, comprehensive_scoring_result)
+        result = all_agent_results["gap_detector"]
 
         assert result.success is True
         gap_analysis = result.output["gap_analysis"]
@@ -282,12 +305,9 @@ class TestAgentIntegration:
         assert 0 <= gap_analysis["data_freshness_score"] <= 100
         assert 0 <= gap_analysis["monitoring_completeness"] <= 100
 
-    def test_hypothesis_generator_integration(
-        self, all_agents, comprehensive_context, comprehensive_scoring_result
-    ):
+    def test_hypothesis_generator_integration(self, all_agent_results):
         """Test hypothesis generator integration."""
-        hypothesis_generator = all_agents["hypothesis_generator"]
-        result = hypothesis_generator.analyze(comprehensive_context, comprehensive_scoring_result)
+        result = all_agent_results["hypothesis_generator"]
 
         assert result.success is True
         hypothesis_analysis = result.output["hypothesis_analysis"]
@@ -304,12 +324,9 @@ class TestAgentIntegration:
         # Should have recommended investigations
         assert len(hypothesis_analysis["recommended_investigations"]) > 0
 
-    def test_explainability_integration(
-        self, all_agents, comprehensive_context, comprehensive_scoring_result
-    ):
+    def test_explainability_integration(self, all_agent_results):
         """Test explainability integration."""
-        explainability_agent = all_agents["explainability_agent"]
-        result = explainability_agent.analyze(comprehensive_context, comprehensive_scoring_result)
+        result = all_agent_results["explainability_agent"]
 
         assert result.success is True
         explainability_result = result.output["explainability_result"]
@@ -333,101 +350,62 @@ class TestAgentIntegration:
         # Should have all agents registered
         assert len(orchestrator.list_agents()) == len(all_agents)
 
+        # Membership checks should see every registered agent
+        for agent in all_agents.values():
+            assert agent.name in orchestrator
+            assert agent.name in orchestrator.agent_names
+        assert "unknown_agent" not in orchestrator
+
         # Should be able to get agent info
         for agent_name in all_agents.keys():
             agent_info = orchestrator.get_agent_info(agent_name)
             assert agent_info["name"] == agent_name
 
-    def test_sequential_pipeline_execution(
-        self, orchestrator, all_agents, comprehensive_context, comprehensive_scoring_result
+    @pytest.mark.parametrize("mode", ["sequential", "parallel", "single"])
+    def test_orchestrated_execution(
+        self,
+        orchestrator,
+        all_agents,
+        comprehensive_context,
+        comprehensive_scoring_result,
+        mode,
     ):
-        """Test sequential pipeline execution."""
-        # Register agents
-        for agent in all_agents.values():
-            orchestrator.register_agent(agent)
+        """Test sequential, parallel and single agent execution through orchestrator."""
+        if mode == "single":
+            # Execute single agent
+            result = orchestrator.execute_agent(
+                "integration_summarizer",
+                comprehensive_context,
+                comprehensive_scoring_result,
+                user="integration_test_user",
+            )
+            results = {result.agent_name: result}
+        else:
+            # Create pipeline with all agents
+            pipeline_name = f"integration_{mode}"
+            pipeline = orchestrator.create_pipeline(pipeline_name, parallel=mode == "parallel")
+            for agent in all_agents.values():
+                pipeline.add_agent(agent)
 
-        # Create sequential pipeline
-        pipeline = orchestrator.create_pipeline("integration_sequential", parallel=False)
+            # Execute pipeline
+            results = orchestrator.execute_pipeline(
+                pipeline_name,
+                comprehensive_context,
+                comprehensive_scoring_result,
+                user="integration_test_user",
+            )
 
-        # Add agents to pipeline
-        for agent in all_agents.values():
-            pipeline.add_agent(agent)
-
-        # Execute pipeline
-        results = orchestrator.execute_pipeline(
-            "integration_sequential",
-            comprehensive_context,
-            comprehensive_scoring_result,
-            user="integration_test_user",
-        )
-
-        # Should have results from all agents
-        assert len(results) == len(all_agents)
+            # Should have results from all agents
+            assert len(results) == len(all_agents)
 
         # All results should be successful
         for agent_name, result in results.items():
             assert result.success is True
             assert "output" in result.output
 
-    def test_parallel_pipeline_execution(
-        self, orchestrator, all_agents, comprehensive_context, comprehensive_scoring_result
-    ):
-        """Test parallel pipeline execution."""
-        # Register agents
-        for agent in all_agents.values():
-            orchestrator.register_agent(agent)
-
-        # Create parallel pipeline
-        pipeline = orchestrator.create_pipeline("integration_parallel", parallel=True)
-
-        # Add agents to pipeline
-        for agent in all_agents.values():
-            pipeline.add_agent(agent)
-
-        # Execute pipeline
-        results = orchestrator.execute_pipeline(
-            "integration_parallel",
-            comprehensive_context,
-            comprehensive_scoring_result,
-            user="integration_test_user",
-        )
-
-        # Should have results from all agents
-        assert len(results) == len(all_agents)
-
-        # All results should be successful
-        for agent_name, result in results.items():
-            assert result.success is True
-
-    def test_single_agent_execution(
-        self, orchestrator, all_agents, comprehensive_context, comprehensive_scoring_result
-    ):
-        """Test single agent execution through orchestrator."""
-        # Register agents
-        for agent in all_agents.values():
-            orchestrator.register_agent(agent)
-
-        # Execute single agent
-        result = orchestrator.execute_agent(
-            "integration_summarizer",
-            comprehensive_context,
-            comprehensive_scoring_result,
-            user="integration_test_user",
-        )
-
-        assert result.success is True
-        assert "output" in result.output
-
-    def test_cross_agent_data_consistency(
-        self, all_agents, comprehensive_context, comprehensive_scoring_result
-    ):
+    def test_cross_agent_data_consistency(self, all_agent_results):
         """Test data consistency across agents."""
-        results = {}
-
-        # Run all agents
-        for agent_name, agent in all_agents.items():
-            result = agent.analyze(comprehensive_context, comprehensive_scoring_result)
-            results[agent_name] = result.output
+        results = {agent_name: result.output for agent_name, result in all_agent_results.items()}
 
         # Check entity ID consistency
         entity_ids = []
@@ -452,16 +430,9 @@ class TestAgentIntegration:
             # All should reference the same scoring result
             assert len(set(scores)) == 1
 
-    def test_complementary_analysis(
-        self, all_agents, comprehensive_context, comprehensive_scoring_result
-    ):
+    def test_complementary_analysis(self, all_agent_results, comprehensive_context):
         """Test that agents provide complementary analysis."""
-        results = {}
-
-        # Run all agents
-        for agent_name, agent in all_agents.items():
-            result = agent.analyze(comprehensive_context, comprehensive_scoring_result)
-            results[agent_name] = result.output
+        results = {agent_name: result.output for agent_name, result in all_agent_results.items()}
 
         # Context summarizer should provide overview
         summary = results["context_summarizer"]["summary"]
@@ -479,42 +450,8 @@ class TestAgentIntegration:
         explainability_result = results["explainability_agent"]["explainability_result"]
         assert len(explainability_result["explanations"]) > 0
 
-    def test_performance_with_comprehensive_data(
-        self, all_agents, comprehensive_context, comprehensive_scoring_result
-    ):
-        """Test performance with comprehensive data."""
-        import time
-
-        # Measure execution time for all agents
-        start_time = time.time()
-
-        results = {}
-        for agent_name, agent in all_agents.items():
-            agent_start = time.time()
-            result = agent.analyze(comprehensive_context, comprehensive_scoring_result)
-            agent_end = time.time()
-
-            results[agent_name] = {"result": result, "duration": agent_end - agent_start}
-
-        total_time = time.time() - start_time
-
-        # All should complete successfully
-        for agent_name, data in results.items():
-            assert data["result"].success is True
-
-        # Performance should be reasonable (less than 10 seconds total)
-        assert total_time < 10.0
-
-        # No single agent should take too long (less than 5 seconds)
-        for agent_name, data in results.items():
-            assert data["duration"] < 5.0
-
     def test_error_propagation(self, orchestrator, all_agents, comprehensive_context):
         """Test error handling and propagation."""
-        # Register agents
-        for agent in all_agents.values():
-            orchestrator.register_agent(agent)
-
         # Execute pipeline without scoring result (should handle gracefully)
         pipeline = orchestrator.create_pipeline("error_test", parallel=False)
         for agent in all_agents.values():
@@ -535,10 +472,6 @@ class TestAgentIntegration:
         self, orchestrator, all_agents, comprehensive_context, comprehensive_scoring_result
     ):
         """Test audit trail consistency across agents."""
-        # Register agents
-        for agent in all_agents.values():
-            orchestrator.register_agent(agent)
-
         # Execute pipeline
         pipeline = orchestrator.create_pipeline("audit_test", parallel=False)
         for agent in all_agents.values():
@@ -571,10 +504,6 @@ class TestAgentIntegration:
 
     def test_pipeline_configuration(self, orchestrator, all_agents):
         """Test pipeline configuration options."""
-        # Register agents
-        for agent in all_agents.values():
-            orchestrator.register_agent(agent)
-
         # Test different pipeline configurations
         configs = [
             {"name": "seq_test", "parallel": False},
@@ -597,22 +526,11 @@ class TestAgentIntegration:
         self, orchestrator, all_agents, comprehensive_context, comprehensive_scoring_result
     ):
         """Test comprehensive real-world scenario."""
-        # Register all agents
-        for agent in all_agents.values():
-            orchestrator.register_agent(agent)
-
         # Create comprehensive pipeline
         pipeline = orchestrator.create_pipeline("comprehensive_analysis", parallel=False)
 
         # Add all agents in logical order
-        analysis_order = [
-            "context_summarizer",  # First: understand the context
-            "gap_detector",  # Second: identify gaps
-            "hypothesis_generator",  # Third: generate hypotheses
-            "explainability_agent",  # Fourth: explain results
-        ]
-
-        for agent_name in analysis_order:
+        for agent_name in _ANALYSIS_ORDER:
             pipeline.add_agent(all_agents[agent_name])
 
         # Execute comprehensive analysis
@@ -630,11 +548,10 @@ class TestAgentIntegration:
         for agent_name, result in results.items():
             assert result.success is True
 
-        # Verify logical flow in results
-        summary_result = results["integration_summarizer"]
-        gap_result = results["integration_gap_detector"]
-        hypothesis_result = results["integration_hypothesis_generator"]
-        explainability_result = results["integration_explainability"]
+        # Verify logical flow in results, unpacked in pipeline order
+        summary_result, gap_result, hypothesis_result, explainability_result = (
+            results[agent.name] for agent in pipeline.agents
+        )
 
         # Context should be summarized
         summary_data = summary_result.output["summary"]["summary"]
@@ -678,10 +595,6 @@ class TestMCPIntegration:
 
     def test_pipeline_persistence(self, orchestrator, all_agents):
         """Test pipeline state persistence."""
-        # Register agents
-        for agent in all_agents.values():
-            orchestrator.register_agent(agent)
-
         # Create pipeline
         pipeline = orchestrator.create_pipeline("persistent_test")
         pipeline.add_agent(all_agents["context_summarizer"])
@@ -699,10 +612,6 @@ class TestMCPIntegration:
         self, orchestrator, all_agents, comprehensive_context, comprehensive_scoring_result
     ):
         """Test pipeline results tracking."""
-        # Register agents
-        for agent in all_agents.values():
-            orchestrator.register_agent(agent)
-
         # Create and execute pipeline
         pipeline = orchestrator.create_pipeline("results_test")
         pipeline.add_agent(all_agents["context_summarizer"])
@@ -719,6 +628,40 @@ class TestMCPIntegration:
         for agent_name, result in pipeline.results.items():
             assert result.success is True
 
+    def test_pipeline_summary(self):
+        """Test columnar pipeline result summary."""
+        pipeline = MCPPipeline(name="summary_test")
+        pipeline.results = {
+            "first": AgentResult(agent_name="first", success=True, duration_ms=12.5),
+            "second": AgentResult(agent_name="second", success=False, error="failed"),
+        }
+
+        summary = pipeline.summary()
+
+        assert summary["pipeline"] == "summary_test"
+        assert summary["agents"] == ["first", "second"]
+        assert list(summary["success"]) == [1, 0]
+        assert list(summary["duration_ms"]) == [12.5, 0.0]
+
+        # In-place writes to results show up in the next summary
+        pipeline.results["second"] = AgentResult(agent_name="second", success=True)
+        assert list(pipeline.summary()["success"]) == [1, 1]
+
+    def test_registry_views(self, orchestrator, all_agents):
+        """Test read-only agent and pipeline views."""
+        agents_view = orchestrator.agents_view()
+        pipelines_view = orchestrator.pipelines_view()
+
+        orchestrator.create_pipeline("view_test")
+
+        # Views reflect the registries, including later changes
+        assert set(agents_view) == {agent.name for agent in all_agents.values()}
+        assert "view_test" in pipelines_view
+
+        # Views cannot be mutated
+        with pytest.raises(TypeError):
+            agents_view["other"] = all_agents["gap_detector"]
+
     def test_agent_state_management(
         self, all_agents, comprehensive_context, comprehensive_scoring_result
     ):
@@ -739,24 +682,20 @@ class TestMCPIntegration:
         assert "last_result" in state
         assert state["last_result"]["success"] is True
 
-    def test_error_handling_in_pipeline(self, orchestrator, all_agents, comprehensive_context):
-        """Test error handling within pipeline execution."""
-        # Register agents
-        for agent in all_agents.values():
-            orchestrator.register_agent(agent)
-
-        # Create pipeline with timeout
+    @pytest.mark.asyncio
+    async def test_error_handling_in_pipeline(self, orchestrator, comprehensive_context):
+        """Test agent timeouts are reported as failed results."""
+        # Create pipeline with an agent that cannot finish in time
         pipeline = orchestrator.create_pipeline("timeout_test")
-        pipeline.add_agent(all_agents["context_summarizer"])
+        pipeline.add_agent(SlowAgent(name="integration_slow_agent"))
 
-        # Execute with very short timeout (may cause timeout)
-        results = orchestrator.execute_pipeline(
-            "timeout_test", comprehensive_context, None, timeout=0.001  # Very short timeout
+        results = await orchestrator.execute_pipeline(
+            "timeout_test", comprehensive_context, None, timeout=0.01
         )
 
         # Should handle timeout gracefully
         assert len(results) == 1
 
-        # Result may indicate timeout or success depending on execution speed
-        result = results["integration_summarizer"]
-        assert result.success is True or "timeout" in result.error.lower() if result.error else True
+        result = results["integration_slow_agent"]
+        assert result.success is False
+        assert "timed out" in result.error
@@ -2,7 +2,10 @@
 Tests for Context Summarizer Agent.
 """
 
+import asyncio
+import time
 import pytest
+import pytest_asyncio
 from datetime import datetime, timedelta
 
 from core.models.entity import Entity
@@ -11,8 +14,11 @@ from core.models.context import Context
 from core.scoring.risk import ScoringResult
 from agents.agents.context_summarizer import ContextSummarizer
 
+# Shared timestamp for test data; no test depends on signal or score freshness
+_FIXED_TIMESTAMP = datetime(2024, 1, 1)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def summarizer():
     """Create Context Summarizer instance."""
     return ContextSummarizer(
@@ -24,7 +30,7 @@ def summarizer():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_entity():
     """Create sample entity."""
     return Entity(
@@ -35,9 +41,8 @@ def sample_entity():
     )
 
 
-@pytest.fixture
-def sample_signals():
-    """Create sample signals."""
+def build_sample_signals():
+    """Build the sample signal set."""
     return [
         Signal(
             id="signal-001",
@@ -45,7 +50,7 @@ def sample_signals():
             signal_type="VULNERABILITY",
             severity="CRITICAL",
             description="Critical vulnerability detected",
-            timestamp=datetime.utcnow(),
+            timestamp=_FIXED_TIMESTAMP,
         ),
         Signal(
             id="signal-002",
@@ -53,7 +58,7 @@ def sample_signals():
             signal_type="OPEN_PORT",
             severity="HIGH",
             description="Open port 22 (SSH)",
-            timestamp=datetime.utcnow(),
+            timestamp=_FIXED_TIMESTAMP,
         ),
         Signal(
             id="signal-003",
@@ -61,11 +66,17 @@ def sample_signals():
             signal_type="CERTIFICATE",
             severity="MEDIUM",
             description="SSL certificate expires in 30 days",
-            timestamp=datetime.utcnow(),
+            timestamp=_FIXED_TIMESTAMP,
         ),
     ]
 
 
+@pytest.fixture
+def sample_signals():
+    """Create sample signals."""
+    return build_sample_signals()
+
+
 @pytest.fixture
 def sample_context(sample_entity, sample_signals):
     """Create sample context."""
@@ -75,7 +86,52 @@ def sample_context(sample_entity, sample_signals):
     return context
 
 
-@pytest.fixture
+def build_scanner_signals(count, signal_type, severity, description):
+    """Build numbered scanner signals."""
+    return [
+        Signal(
+            id=f"signal-{i}",
+            source="scanner",
+            signal_type=signal_type,
+            severity=severity,
+            description=f"{description} {i}",
+            timestamp=_FIXED_TIMESTAMP,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(scope="module")
+def vuln_signals_10():
+    """Create more critical vulnerability signals than max_risks."""
+    return build_scanner_signals(10, "VULNERABILITY", "CRITICAL", "Vulnerability")
+
+
+@pytest.fixture(scope="module")
+def port_signals_10():
+    """Create more open port signals than max_exposures."""
+    return build_scanner_signals(10, "OPEN_PORT", "MEDIUM", "Port")
+
+
+@pytest.fixture(scope="module")
+def large_signal_sets():
+    """Create large vulnerability signal sets keyed by size."""
+    return {
+        count: build_scanner_signals(count, "VULNERABILITY", "MEDIUM", "Signal")
+        for count in (100, 1000)
+    }
+
+
+@pytest_asyncio.fixture(scope="module")
+async def basic_analysis(summarizer, sample_entity):
+    """Analyze the sample context once for the output structure tests."""
+    context = Context(name="test_context")
+    context.entity = sample_entity
+    context.signals = build_sample_signals()
+    return await summarizer.analyze(context)
+
+
+@pytest.fixture(scope="session")
 def risk_scoring_result():
     """Create risk scoring result."""
     return ScoringResult(
@@ -85,11 +141,11 @@ def risk_scoring_result():
         factors={"vulnerabilities": 0.5, "ports": 0.25},
         metrics={"critical_count": 1},
         recommendations=["Update systems", "Close unnecessary ports"],
-        timestamp=datetime.utcnow(),
+        timestamp=_FIXED_TIMESTAMP,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def exposure_scoring_result():
     """Create exposure scoring result."""
     return ScoringResult(
@@ -99,11 +155,11 @@ def exposure_scoring_result():
         factors={"public_access": 0.6, "services": 0.5},
         metrics={"open_ports": 3},
         recommendations=["Reduce public accessibility"],
-        timestamp=datetime.utcnow(),
+        timestamp=_FIXED_TIMESTAMP,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def drift_scoring_result():
     """Create drift scoring result."""
     return ScoringResult(
@@ -113,7 +169,7 @@ def drift_scoring_result():
         factors={"property_changes": 0.3, "signal_changes": 0.15},
         metrics={"changes_count": 5},
         recommendations=["Review recent changes"],
-        timestamp=datetime.utcnow(),
+        timestamp=_FIXED_TIMESTAMP,
     )
 
 
@@ -132,10 +188,9 @@ async def test_summarizer_initialization(summarizer):
     assert summarizer.max_anomalies == 3
 
 
-@pytest.mark.asyncio
-async def test_summarizer_analyze_basic(summarizer, sample_context):
+def test_summarizer_analyze_basic(basic_analysis):
     """Test basic analyze functionality."""
-    result = await summarizer.analyze(sample_context)
+    result = basic_analysis
 
     assert result.success
     assert result.agent_name == "test_summarizer"
@@ -163,10 +218,9 @@ async def test_summarizer_analyze_missing_entity(summarizer):
 # ============================================================================
 
 
-@pytest.mark.asyncio
-async def test_summary_output_structure(summarizer, sample_context):
+def test_summary_output_structure(basic_analysis):
     """Test summary output has correct structure."""
-    result = await summarizer.analyze(sample_context)
+    result = basic_analysis
     summary = result.output
 
     # Required fields
@@ -183,10 +237,9 @@ async def test_summary_output_structure(summarizer, sample_context):
     assert isinstance(summary["signal_statistics"], dict)
 
 
-@pytest.mark.asyncio
-async def test_risk_extraction(summarizer, sample_context):
+def test_risk_extraction(basic_analysis):
     """Test top risks extraction."""
-    result = await summarizer.analyze(sample_context)
+    result = basic_analysis
     risks = result.output["top_risks"]
 
     # Should have at least one critical/high risk
@@ -200,10 +253,9 @@ async def test_risk_extraction(summarizer, sample_context):
         assert "timestamp" in risk
 
 
-@pytest.mark.asyncio
-async def test_exposure_extraction(summarizer, sample_context):
+def test_exposure_extraction(basic_analysis):
     """Test exposure highlights extraction."""
-    result = await summarizer.analyze(sample_context)
+    result = basic_analysis
     exposures = result.output["exposure_highlights"]
 
     # Should have at least one exposure
@@ -216,10 +268,9 @@ async def test_exposure_extraction(summarizer, sample_context):
         assert "description" in exposure or "description" in exposure
 
 
-@pytest.mark.asyncio
-async def test_anomaly_extraction(summarizer, sample_context):
+def test_anomaly_extraction(basic_analysis):
     """Test configuration anomalies extraction."""
-    result = await summarizer.analyze(sample_context)
+    result = basic_analysis
     anomalies = result.output["configuration_anomalies"]
 
     # Anomalies are optional
@@ -240,10 +291,10 @@ async def test_analyze_with_risk_score(summarizer, sample_context, risk_scoring_
     risks = result.output["top_risks"]
 
     # Should include risk engine result
-    risk_from_engine = [r for r in risks if r.get("source") == "risk_engine"]
-    assert len(risk_from_engine) > 0
-    assert risk_from_engine[0]["severity"] == "HIGH"
-    assert risk_from_engine[0]["score"] == 75.5
+    risk_from_engine = next((r for r in risks if r.get("source") == "risk_engine"), None)
+    assert risk_from_engine is not None
+    assert risk_from_engine["severity"] == "HIGH"
+    assert risk_from_engine["score"] == 75.5
 
 
 @pytest.mark.asyncio
@@ -255,9 +306,9 @@ async def test_analyze_with_exposure_score(summarizer, sample_context, exposure_
     exposures = result.output["exposure_highlights"]
 
     # Should include exposure engine result
-    exposure_from_engine = [e for e in exposures if e.get("type") == "public_exposure"]
-    assert len(exposure_from_engine) > 0
-    assert exposure_from_engine[0]["severity"] == "HIGH"
+    exposure_from_engine = next((e for e in exposures if e.get("type") == "public_exposure"), None)
+    assert exposure_from_engine is not None
+    assert exposure_from_engine["severity"] == "HIGH"
 
 
 @pytest.mark.asyncio
@@ -277,61 +328,41 @@ async def test_analyze_with_drift_score(summarizer, sample_context, drift_scorin
 # ============================================================================
 
 
+@pytest.mark.parametrize(
+    "risks,exposures,anomalies,priority,keyword,critical_findings",
+    [
+        (
+            [{"severity": "CRITICAL"}, {"severity": "CRITICAL"}, {"severity": "HIGH"}],
+            [{"type": "exposure"}],
+            [],
+            "CRITICAL",
+            "immediate investigation",
+            2,
+        ),
+        ([{"severity": "CRITICAL"}], [{"type": "exposure"}], [], "HIGH", "urgent", None),
+        (
+            [{"severity": "HIGH"}],
+            [{"type": "exposure"}, {"type": "exposure"}],
+            [],
+            "MEDIUM",
+            "schedule",
+            None,
+        ),
+        ([], [], [], "LOW", "routine monitoring", None),
+    ],
+    ids=["critical", "high", "medium", "low"],
+)
 @pytest.mark.asyncio
-async def test_assessment_critical_priority(summarizer):
-    """Test CRITICAL priority assessment."""
-    risks = [
-        {"severity": "CRITICAL"},
-        {"severity": "CRITICAL"},
-        {"severity": "HIGH"},
-    ]
-    exposures = [{"type": "exposure"}]
-    anomalies = []
-
-    assessment = await summarizer._generate_assessment(risks, exposures, anomalies)
-
-    assert assessment["priority"] == "CRITICAL"
-    assert assessment["critical_findings"] == 2
-    assert "immediate investigation" in assessment["recommendation"].lower()
-
-
-@pytest.mark.asyncio
-async def test_assessment_high_priority(summarizer):
-    """Test HIGH priority assessment."""
-    risks = [{"severity": "CRITICAL"}]
-    exposures = [{"type": "exposure"}]
-    anomalies = []
-
-    assessment = await summarizer._generate_assessment(risks, exposures, anomalies)
-
-    assert assessment["priority"] == "HIGH"
-    assert "urgent" in assessment["recommendation"].lower()
-
-
-@pytest.mark.asyncio
-async def test_assessment_medium_priority(summarizer):
-    """Test MEDIUM priority assessment."""
-    risks = [{"severity": "HIGH"}]
-    exposures = [{"type": "exposure"}, {"type": "exposure"}]
-    anomalies = []
-
-    assessment = await summarizer._generate_assessment(risks, exposures, anomalies)
-
-    assert assessment["priority"] == "MEDIUM"
-    assert "schedule" in assessment["recommendation"].lower()
-
-
-@pytest.mark.asyncio
-async def test_assessment_low_priority(summarizer):
-    """Test LOW priority assessment."""
-    risks = []
-    exposures = []
-    anomalies = []
-
+async def test_assessment_priority(
+    summarizer, risks, exposures, anomalies, priority, keyword, critical_findings
+):
+    """Test assessment priority and recommendation for each priority level."""
     assessment = await summarizer._generate_assessment(risks, exposures, anomalies)
 
-    assert assessment["priority"] == "LOW"
-    assert "routine monitoring" in assessment["recommendation"].lower()
+    assert assessment["priority"] == priority
+    assert keyword in assessment["recommendation"].lower()
+    if critical_findings is not None:
+        assert assessment["critical_findings"] == critical_findings
 
 
 # ============================================================================
@@ -339,10 +370,9 @@ async def test_assessment_low_priority(summarizer):
 # ============================================================================
 
 
-@pytest.mark.asyncio
-async def test_signal_statistics(summarizer, sample_context):
+def test_signal_statistics(basic_analysis):
     """Test signal statistics generation."""
-    result = await summarizer.analyze(sample_context)
+    result = basic_analysis
     stats = result.output["signal_statistics"]
 
     assert stats["total_signals"] == 3
@@ -371,56 +401,27 @@ async def test_signal_statistics_empty(summarizer, sample_entity):
 # ============================================================================
 
 
+@pytest.mark.parametrize(
+    "signals_fixture,output_key,limit_attr",
+    [
+        ("vuln_signals_10", "top_risks", "max_risks"),
+        ("port_signals_10", "exposure_highlights", "max_exposures"),
+    ],
+)
 @pytest.mark.asyncio
-async def test_max_risks_limit(summarizer, sample_entity):
-    """Test that max_risks limit is respected."""
-    # Create more signals than max_risks
-    signals = [
-        Signal(
-            id=f"signal-{i}",
-            source="scanner",
-            signal_type="VULNERABILITY",
-            severity="CRITICAL",
-            description=f"Vulnerability {i}",
-            timestamp=datetime.utcnow(),
-        )
-        for i in range(10)
-    ]
-
-    context = Context(name="test")
-    context.entity = sample_entity
-    context.signals = signals
-
-    result = await summarizer.analyze(context)
-    risks = result.output["top_risks"]
-
-    assert len(risks) <= summarizer.max_risks
-
-
-@pytest.mark.asyncio
-async def test_max_exposures_limit(summarizer, sample_entity):
-    """Test that max_exposures limit is respected."""
-    # Create more exposures than max_exposures
-    signals = [
-        Signal(
-            id=f"signal-{i}",
-            source="scanner",
-            signal_type="OPEN_PORT",
-            severity="MEDIUM",
-            description=f"Port {i}",
-            timestamp=datetime.utcnow(),
-        )
-        for i in range(10)
-    ]
-
+async def test_max_items_limit(
+    request, summarizer, sample_entity, signals_fixture, output_key, limit_attr
+):
+    """Test that max_risks and max_exposures limits are respected."""
+    # Context has more signals than the limit allows
     context = Context(name="test")
     context.entity = sample_entity
-    context.signals = signals
+    context.signals = request.getfixturevalue(signals_fixture)
 
     result = await summarizer.analyze(context)
-    exposures = result.output["exposure_highlights"]
+    items = result.output[output_key]
 
-    assert len(exposures) <= summarizer.max_exposures
+    assert len(items) <= getattr(summarizer, limit_attr)
 
 
 # ============================================================================
@@ -438,7 +439,7 @@ async def test_analyze_with_invalid_signals(summarizer, sample_entity):
             signal_type="UNKNOWN_TYPE",
             severity="LOW",
             description="Unknown signal",
-            timestamp=datetime.utcnow(),
+            timestamp=_FIXED_TIMESTAMP,
         )
     ]
 
@@ -471,8 +472,8 @@ async def test_analyze_with_none_entity(summarizer):
 
 
 @pytest.mark.asyncio
-async def test_agent_run_method(summarizer, sample_context):
-    """Test agent.run() method with timeout."""
+async def test_agent_run_and_state_tracking(summarizer, sample_context):
+    """Test agent.run() with timeout and the agent state it leaves behind."""
     result = await summarizer.run(sample_context, user="analyst-001", timeout=30.0)
 
     assert result.success
@@ -480,14 +481,7 @@ async def test_agent_run_method(summarizer, sample_context):
     assert result.duration_ms > 0
     assert "entity_id" in result.output
 
-
-@pytest.mark.asyncio
-async def test_agent_state_tracking(summarizer, sample_context):
-    """Test agent state after execution."""
-    result1 = await summarizer.run(sample_context, timeout=30.0)
-
-    assert summarizer.last_result is not None
-    assert summarizer.last_result.success
+    assert summarizer.last_result is result
 
     state = summarizer.get_state()
     assert state["name"] == "test_summarizer"
@@ -500,38 +494,55 @@ async def test_agent_state_tracking(summarizer, sample_context):
 # ============================================================================
 
 
-@pytest.mark.asyncio
-async def test_large_signal_set_performance(summarizer, sample_entity):
-    """Test performance with large signal set."""
-    # Create 100 signals
-    signals = [
-        Signal(
-            id=f"signal-{i}",
-            source="scanner",
-            signal_type="VULNERABILITY",
-            severity="MEDIUM",
-            description=f"Signal {i}",
-            timestamp=datetime.utcnow(),
-        )
-        for i in range(100)
-    ]
-
+async def _timed_run(summarizer, entity, signals):
+    """Run the summarizer over ``signals`` and return (result, elapsed ms)."""
     context = Context(name="test")
-    context.entity = sample_entity
+    context.entity = entity
     context.signals = signals
 
+    start = time.perf_counter_ns()
     result = await summarizer.run(context, timeout=30.0)
+    return result, (time.perf_counter_ns() - start) / 1_000_000
+
+
+@pytest.mark.perf
+@pytest.mark.asyncio
+@pytest.mark.parametrize("signal_count", [100, 1000])
+async def test_large_signal_set_performance(
+    summarizer, sample_entity, large_signal_sets, signal_count
+):
+    """Test performance with large signal sets."""
+    result, elapsed_ms = await _timed_run(
+        summarizer, sample_entity, large_signal_sets[signal_count]
+    )
 
     assert result.success
-    assert result.duration_ms < 5000  # Should complete in under 5 seconds
+    assert elapsed_ms < 500
 
 
+@pytest.mark.perf
 @pytest.mark.asyncio
-async def test_concurrent_execution(summarizer, sample_context):
-    """Test concurrent execution of multiple analyses."""
-    tasks = [summarizer.analyze(sample_context) for _ in range(5)]
+async def test_large_signal_set_scaling(summarizer, sample_entity, large_signal_sets):
+    """Test that 10x the signals stays under 30x the runtime, catching quadratic growth."""
+    _, elapsed_100 = await _timed_run(summarizer, sample_entity, large_signal_sets[100])
+    _, elapsed_1000 = await _timed_run(summarizer, sample_entity, large_signal_sets[1000])
+
+    # Floor the baseline at 1ms so scheduler jitter on a sub-ms run can't fail the ratio
+    assert elapsed_1000 < max(elapsed_100, 1.0) * 30
 
-    results = await asyncio.gather(*tasks)
+
+@pytest.mark.asyncio
+async def test_concurrent_execution(summarizer, sample_entity):
+    """Test concurrent execution of multiple analyses."""
+    # Each analysis gets its own context and signal list
+    contexts = []
+    for i in range(5):
+        context = Context(name=f"concurrent_{i}")
+        context.entity = sample_entity
+        context.signals = build_sample_signals()
+        contexts.append(context)
+
+    results = await asyncio.gather(*(summarizer.analyze(context) for context in contexts))
 
     assert all(r.success for r in results)
     assert len(results) == 5
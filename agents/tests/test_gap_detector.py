@@ -187,6 +187,26 @@ class TestGapDetector:
         assert len(coverage_gaps) > 0
         assert coverage_gaps[0]["title"] == "No Data Coverage"
 
+    def test_no_signals_missing_signal_gaps(self, gap_detector, sample_entity):
+        """Test every required signal type is reported missing when no signals present."""
+        context = Context(entity=sample_entity, signals=[])
+        result = gap_detector.analyze(context)
+        analysis = result.output["gap_analysis"]
+
+        missing = {
+            gap["expected_signals"][0]
+            for gap in analysis["gaps"]
+            if gap["gap_type"] == "missing_signal"
+        }
+        assert missing == set(gap_detector.entity_type_requirements["host"])
+        assert not [
+            gap
+            for gap in analysis["gaps"]
+            if gap["gap_type"] in {"outdated_data", "correlation_gap"}
+        ]
+        assert analysis["coverage_score"] == 0.0
+        assert analysis["data_freshness_score"] == 0.0
+
     def test_coverage_score_calculation(self, gap_detector, sample_context):
         """Test coverage score calculation."""
         result = gap_detector.analyze(sample_context)
@@ -366,6 +386,37 @@ class TestGapDetector:
         for gap in analysis["gaps"]:
             assert 0 <= gap["impact_score"] <= 1
 
+    def test_missing_impact_lookup(self, gap_detector):
+        """Test precomputed missing-signal impact table and defaults."""
+        assert gap_detector._calculate_missing_impact("VULNERABILITY", "host") == 1.0
+        assert gap_detector._calculate_missing_impact("PORT", "network") == pytest.approx(0.49)
+        # Unknown entity type falls back to the default modifier
+        assert gap_detector._calculate_missing_impact("VULNERABILITY", "unknown") == 0.5
+        # Unknown signal type falls back to the default base impact
+        assert gap_detector._calculate_missing_impact("UNKNOWN", "host") == 0.3
+        assert gap_detector._calculate_missing_impact("UNKNOWN", "unknown") == pytest.approx(0.15)
+
+    def test_analysis_cache(self, gap_detector, sample_context, sample_scoring_result):
+        """Test repeated analysis of an identical context reuses the cached result."""
+        first = gap_detector.analyze(sample_context)
+        second = gap_detector.analyze(sample_context)
+
+        assert first.output == second.output
+        assert len(gap_detector._cache) == 1
+
+        # Scoring results bypass the cache
+        gap_detector.analyze(sample_context, sample_scoring_result)
+        assert len(gap_detector._cache) == 1
+
+    def test_analysis_cache_eviction(self):
+        """Test analysis cache evicts least recently used entries."""
+        detector = GapDetector(cache_size=2)
+        for i in range(3):
+            entity = Entity(id=f"host-{i}", entity_type="host", name=f"host-{i}")
+            detector.analyze(Context(entity=entity, signals=[]))
+
+        assert len(detector._cache) == 2
+
     def test_missing_evidence_tracking(self, gap_detector, sample_context):
         """Test missing evidence tracking."""
         result = gap_detector.analyze(sample_context)
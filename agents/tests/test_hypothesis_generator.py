@@ -2,6 +2,7 @@
 Tests for Hypothesis Generator Agent.
 """
 
+import asyncio
 import pytest
 from datetime import datetime, timedelta
 
@@ -197,6 +198,39 @@ class TestHypothesisGenerator:
         ]
         assert len(creative_hypotheses) >= 0  # May or may not have creative hypotheses
 
+    def test_creative_hypotheses_do_not_share_lists(self, hypothesis_generator):
+        """Test mutating a creative hypothesis leaves later analyses untouched."""
+        signal_index = hypothesis_generator._index_signals(
+            [
+                Signal(
+                    id="signal-005",
+                    source="dependency_scanner",
+                    signal_type="DEPENDENCY",
+                    severity="medium",
+                    description="Third-party dependency detected",
+                    data={},
+                    timestamp=datetime.utcnow(),
+                )
+            ]
+        )
+
+        first = asyncio.run(hypothesis_generator._generate_creative_hypotheses(signal_index))
+        assert len(first) > 0
+        for hypothesis in first:
+            hypothesis.supporting_signals.append("mutated")
+            hypothesis.missing_evidence.append("mutated")
+            hypothesis.attack_steps.append("mutated")
+            hypothesis.mitigations.append("mutated")
+            hypothesis.related_entities.append("mutated")
+
+        second = asyncio.run(hypothesis_generator._generate_creative_hypotheses(signal_index))
+        for hypothesis in second:
+            assert "mutated" not in hypothesis.supporting_signals
+            assert "mutated" not in hypothesis.missing_evidence
+            assert "mutated" not in hypothesis.attack_steps
+            assert "mutated" not in hypothesis.mitigations
+            assert "mutated" not in hypothesis.related_entities
+
     def test_creative_hypotheses_disabled(self, hypothesis_generator, sample_context):
         """Test with creative hypotheses disabled."""
         hypothesis_generator.enable_creative_hypotheses = False
@@ -271,6 +305,52 @@ class TestHypothesisGenerator:
         ]
         assert len(lateral_hypotheses) > 0
 
+    def test_dns_exfiltration_pattern_hypothesis(self, hypothesis_generator):
+        """Test description pattern rules match case-insensitively."""
+        dns_signals = [
+            Signal(
+                id="signal-001",
+                source="dns_monitor",
+                signal_type="DNS",
+                severity="medium",
+                description="Possible EXFIL via long TXT queries",
+                timestamp=datetime.utcnow(),
+            ),
+        ]
+
+        entity = Entity(id="entity-001", entity_type="domain", name="example.com")
+        result = hypothesis_generator.analyze(Context(entity=entity, signals=dns_signals))
+        analysis = result.output["hypothesis_analysis"]
+
+        exfil_hypotheses = [
+            h for h in analysis["hypotheses"] if h["hypothesis_type"] == "data_exfiltration"
+        ]
+        assert len(exfil_hypotheses) == 1
+
+    def test_rule_predicates(self, hypothesis_generator):
+        """Test compiled rule predicates apply only the checks a rule declares."""
+        _, port_rules = hypothesis_generator._rule_predicates["PORT"]
+        _, port_predicate = port_rules[0]
+
+        assert port_predicate([object()] * 3, set(), 0) is True
+        assert port_predicate([object()] * 2, set(), 5) is False
+
+        uses_patterns, dns_rules = hypothesis_generator._rule_predicates["DNS"]
+        _, dns_predicate = dns_rules[0]
+
+        assert uses_patterns is True
+        assert dns_predicate([object()], {"exfil"}, 0) is True
+        assert dns_predicate([object()], set(), 5) is False
+
+    def test_score_to_confidence_boundaries(self, hypothesis_generator):
+        """Test score thresholds map inclusively to confidence levels."""
+        assert hypothesis_generator._score_to_confidence(39.9) == ConfidenceLevel.VERY_LOW
+        assert hypothesis_generator._score_to_confidence(40) == ConfidenceLevel.LOW
+        assert hypothesis_generator._score_to_confidence(60) == ConfidenceLevel.MEDIUM
+        assert hypothesis_generator._score_to_confidence(80) == ConfidenceLevel.HIGH
+        assert hypothesis_generator._score_to_confidence(90) == ConfidenceLevel.VERY_HIGH
+        assert hypothesis_generator._score_to_confidence(100) == ConfidenceLevel.VERY_HIGH
+
     def test_attack_chain_detection(self, hypothesis_generator, sample_context):
         """Test attack chain detection."""
         # Add signals that form an attack chain
@@ -384,6 +464,18 @@ class TestHypothesisGenerator:
         # Should limit number of hypotheses
         assert analysis["total_hypotheses"] <= 3
 
+    def test_hypothesis_ids_unique(
+        self, hypothesis_generator, sample_context, sample_scoring_result
+    ):
+        """Test hypothesis IDs are unique within and across analyses."""
+        ids = []
+        for _ in range(2):
+            result = hypothesis_generator.analyze(sample_context, sample_scoring_result)
+            ids.extend(h["id"] for h in result.output["hypothesis_analysis"]["hypotheses"])
+
+        assert len(ids) > 0
+        assert len(ids) == len(set(ids))
+
     def test_attack_surface_score(self, hypothesis_generator, sample_context):
         """Test attack surface score calculation."""
         result = hypothesis_generator.analyze(sample_context)
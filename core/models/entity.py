@@ -49,7 +49,7 @@ class EntityStatus(Enum):
     ARCHIVED = "archived"
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     """
     Represents a security entity.
@@ -49,7 +49,7 @@ class SignalConfidence(Enum):
     UNVERIFIED = "unverified"
 
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
     """
     Represents a security signal.